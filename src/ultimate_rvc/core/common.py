@@ -8,7 +8,10 @@ import lazy_loader as lazy
 
 import hashlib
 import json
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache
 from pathlib import Path
 
 from pydantic import AnyHttpUrl, TypeAdapter, ValidationError
@@ -54,6 +57,21 @@ OUTPUT_AUDIO_DIR = AUDIO_DIR / "output"
 FLAG_FILE = MODELS_DIR / ".initialized"
 TRAINING_AUDIO_DIR = AUDIO_DIR / "training"
 
+# NOTE shutil falls back to a buffered read/write loop when zero-copy
+# system calls are unavailable; a 1 MiB buffer amortizes syscall
+# overhead when copying large model and audio files. COPY_BUFSIZE is
+# undocumented and absent from typeshed, hence the pyright
+# suppression.
+shutil.COPY_BUFSIZE = max(  # pyright: ignore[reportAttributeAccessIssue]
+    shutil.COPY_BUFSIZE,  # pyright: ignore[reportAttributeAccessIssue]
+    1024 * 1024,
+)
+
+# NOTE constructing a TypeAdapter compiles a validation schema, so the
+# URL adapter is built once at import rather than per validate_url
+# call.
+_HTTP_URL_ADAPTER = TypeAdapter(AnyHttpUrl)
+
 
 def display_progress(
     message: str,
@@ -96,10 +114,12 @@ def remove_suffix_after(text: str, occurrence: str) -> str:
         The string with the suffix removed.
 
     """
-    location = text.rfind(occurrence)
-    if location == -1:
+    if not occurrence:
+        return text
+    head, sep, _ = text.rpartition(occurrence)
+    if not sep:
         return text
-    return text[: location + len(occurrence)]
+    return head + sep
 
 
 def copy_files_to_new_dir(files: Sequence[StrPath], directory: StrPath) -> None:
@@ -127,8 +147,13 @@ def copy_files_to_new_dir(files: Sequence[StrPath], directory: StrPath) -> None:
             raise NotFoundError(entity=Entity.FILE, location=file_path)
         file_paths.append(file_path)
     dir_path.mkdir(parents=True)
-    for file_path in file_paths:
-        shutil.copyfile(file_path, dir_path / file_path.name)
+    if file_paths:
+        # NOTE copies are dispatched to a thread pool so the I/O of
+        # individual files overlaps, mirroring the parallel deletion
+        # helper in core.manage.common.
+        destinations = [dir_path / file_path.name for file_path in file_paths]
+        with ThreadPoolExecutor(max_workers=min(16, len(file_paths))) as executor:
+            list(executor.map(shutil.copyfile, file_paths, destinations))
 
 
 def copy_file_safe(src: StrPath, dest: StrPath) -> Path:
@@ -153,11 +178,15 @@ def copy_file_safe(src: StrPath, dest: StrPath) -> Path:
     dest_dir = dest_path.parent
     dest_dir.mkdir(parents=True, exist_ok=True)
     dest_file = dest_path
-    counter = 1
 
-    while dest_file.exists():
-        dest_file = dest_dir / f"{dest_path.stem} ({counter}){dest_path.suffix}"
-        counter += 1
+    if dest_file.exists():
+        # NOTE a single scan of the destination directory replaces one
+        # stat call per probed candidate name when resolving collisions.
+        siblings = {entry.name for entry in os.scandir(dest_dir)}
+        counter = 1
+        while dest_file.name in siblings:
+            dest_file = dest_dir / f"{dest_path.stem} ({counter}){dest_path.suffix}"
+            counter += 1
 
     shutil.copyfile(src, dest_file)
     return dest_file
@@ -214,6 +243,10 @@ def json_load(file: StrPath, encoding: str = "utf-8") -> Json:
         The JSON-serializable object loaded from the JSON file.
 
     """
+    # NOTE the default path reads raw bytes and lets the JSON decoder
+    # handle UTF-8 directly, skipping the incremental text I/O layer.
+    if encoding == "utf-8":
+        return json.loads(Path(file).read_bytes())
     with Path(file).open(encoding=encoding) as fp:
         return json.load(fp)
 
@@ -235,18 +268,81 @@ def get_hash(thing: Json, size: int = 5) -> str:
         The hash of the JSON-serializable object.
 
     """
+    # NOTE the object is serialized compactly rather than via
+    # json_dumps, as indentation only adds bytes to hash without
+    # affecting determinism.
     return hashlib.blake2b(
-        json_dumps(thing).encode("utf-8"),
+        json.dumps(thing, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
         digest_size=size,
     ).hexdigest()
 
 
+def _advise_sequential_read(fd: int) -> None:
+    """
+    Hint to the OS that a file will be read sequentially from start to
+    end.
+
+    Parameters
+    ----------
+    fd : int
+        The file descriptor of the file to be read.
+
+    """
+    # NOTE posix_fadvise is unavailable on some platforms, e.g. macOS,
+    # where the hint is simply skipped.
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+
+# NOTE the mtime and size parameters are unused in the body; they key
+# the cache so that a modified file is automatically re-hashed.
+@lru_cache(maxsize=4096)
+def _get_file_hash_cached(
+    file: str,
+    _mtime_ns: int,
+    _file_size: int,
+    size: int,
+) -> str:
+    """
+    Get the hash of a file, memoized by its modification time and
+    size.
+
+    Parameters
+    ----------
+    file : str
+        The path to the file.
+    _mtime_ns : int
+        The modification time of the file in nanoseconds.
+    _file_size : int
+        The size of the file in bytes.
+    size : int
+        The size of the hash in bytes.
+
+    Returns
+    -------
+    str
+        The hash of the file.
+
+    """
+    with Path(file).open("rb") as fp:
+        _advise_sequential_read(fp.fileno())
+        file_hash = hashlib.file_digest(
+            fp,
+            lambda: hashlib.blake2b(digest_size=size),  # type: ignore[reportArgumentType]
+        )
+    return file_hash.hexdigest()
+
+
 # NOTE consider increasing size to 16 otherwise we might have problems
 # with hash collisions
 def get_file_hash(file: StrPath, size: int = 5) -> str:
     """
     Get the hash of a file.
 
+    Hashes of unchanged files are served from a cache keyed on the
+    path, modification time and size of the file, so only the initial
+    call for a given file reads it from disk.
+
     Parameters
     ----------
     file : StrPath
@@ -259,19 +355,45 @@ def get_file_hash(file: StrPath, size: int = 5) -> str:
     str
         The hash of the file.
 
+    """
+    file_path = Path(file)
+    stat_result = file_path.stat()
+    return _get_file_hash_cached(
+        str(file_path),
+        stat_result.st_mtime_ns,
+        stat_result.st_size,
+        size,
+    )
+
+
+def _get_file_digest(file: StrPath) -> bytes:
+    """
+    Get the full digest of a file.
+
+    Parameters
+    ----------
+    file : StrPath
+        The path to the file.
+
+    Returns
+    -------
+    bytes
+        The digest of the file.
+
     """
     with Path(file).open("rb") as fp:
-        file_hash = hashlib.file_digest(
-            fp,
-            lambda: hashlib.blake2b(digest_size=size),  # type: ignore[reportArgumentType]
-        )
-    return file_hash.hexdigest()
+        _advise_sequential_read(fp.fileno())
+        return hashlib.file_digest(fp, hashlib.blake2b).digest()
 
 
 def get_combined_file_hash(files: Sequence[StrPath], size: int = 5) -> str:
     """
     Get the combined hash of a sequence of files.
 
+    The files are digested concurrently and their digests are folded
+    into the combined hash in the given order, so the result is
+    sensitive to the order of the files.
+
     Parameters
     ----------
     files : Sequence[StrPath]
@@ -287,14 +409,35 @@ def get_combined_file_hash(files: Sequence[StrPath], size: int = 5) -> str:
     """
     hasher = hashlib.blake2b(digest_size=size)
 
-    for file in files:
-        with Path(file).open("rb") as fp:
-            for chunk in iter(lambda: fp.read(4096), b""):
-                hasher.update(chunk)
+    # NOTE file reads and the C hash implementation both release the
+    # GIL, so digesting the files in a thread pool overlaps their I/O
+    # and hashing.
+    if files:
+        with ThreadPoolExecutor(max_workers=min(16, len(files))) as executor:
+            # NOTE joining the per-file digests into one contiguous
+            # buffer lets the hasher mix them in a single update.
+            hasher.update(b"".join(executor.map(_get_file_digest, files)))
 
     return hasher.hexdigest()
 
 
+@cache
+def _get_http_session() -> requests.Session:
+    """
+    Get the shared HTTP session used for outgoing requests.
+
+    A single lazily created session reuses TCP and TLS connections
+    across requests to the same host.
+
+    Returns
+    -------
+    requests.Session
+        The shared HTTP session.
+
+    """
+    return requests.Session()
+
+
 def get_file_size(url: str) -> int:
     """
     Get the size of a file at a given URL.
@@ -310,7 +453,7 @@ def get_file_size(url: str) -> int:
         The size of the file at the given URL.
 
     """
-    response = requests.head(url, timeout=10)
+    response = _get_http_session().head(url, timeout=10)
     response.raise_for_status()
     return int(response.headers.get("content-length", 0))
 
@@ -346,10 +489,13 @@ def validate_audio_file_exists(
     """
     if not audio_file:
         raise NotProvidedError(entity=entity)
-    audio_file_path = Path(audio_file)
-    if not audio_file_path.is_file():
-        raise NotFoundError(entity=entity, location=audio_file_path)
-    return audio_file_path
+    # NOTE os.path.isfile accepts both str and Path input and performs
+    # a single stat call without first building an intermediate Path.
+    if not os.path.isfile(audio_file):  # noqa: PTH113
+        raise NotFoundError(entity=entity, location=Path(audio_file))
+    # NOTE inputs that are already Path objects are returned as is to
+    # avoid re-parsing the path.
+    return audio_file if isinstance(audio_file, Path) else Path(audio_file)
 
 
 def validate_audio_dir_exists(
@@ -389,10 +535,11 @@ def validate_audio_dir_exists(
             ui_msg = None
     if not audio_directory:
         raise NotProvidedError(entity=entity, ui_msg=ui_msg)
-    audio_dir_path = Path(audio_directory)
-    if not audio_dir_path.is_dir():
-        raise NotFoundError(entity=entity, location=audio_dir_path)
-    return audio_dir_path
+    if not os.path.isdir(audio_directory):  # noqa: PTH112
+        raise NotFoundError(entity=entity, location=Path(audio_directory))
+    return (
+        audio_directory if isinstance(audio_directory, Path) else Path(audio_directory)
+    )
 
 
 def validate_model(
@@ -483,6 +630,6 @@ def validate_url(url: str) -> None:
     if not url:
         raise NotProvidedError(entity=Entity.URL)
     try:
-        TypeAdapter(AnyHttpUrl).validate_python(url)
+        _HTTP_URL_ADAPTER.validate_python(url)
     except ValidationError:
         raise HttpUrlError(url) from None
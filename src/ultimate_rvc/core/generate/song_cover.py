@@ -11,9 +11,10 @@ import lazy_loader as lazy
 
 import logging
 import operator
+import os
 import shutil
 from contextlib import suppress
-from functools import cache
+from functools import cache, lru_cache
 from pathlib import Path
 from urllib.parse import parse_qs, urlparse
 
@@ -213,14 +214,71 @@ def _get_input_audio_paths() -> list[Path]:
     """
     # NOTE if we later add .json file for input then
     # we need to exclude those here
-    return list(INTERMEDIATE_AUDIO_BASE_DIR.glob("*/00_*"))
+    # NOTE os.scandir is used instead of Path.glob so that directory
+    # checks come from the scanned entries rather than a stat call per
+    # entry.
+    if not INTERMEDIATE_AUDIO_BASE_DIR.is_dir():
+        return []
+    with os.scandir(INTERMEDIATE_AUDIO_BASE_DIR) as base_entries:
+        song_dirs = [
+            entry.path for entry in base_entries if entry.is_dir(follow_symlinks=False)
+        ]
+    input_audio_paths: list[Path] = []
+    for song_dir in song_dirs:
+        with os.scandir(song_dir) as song_dir_entries:
+            input_audio_paths.extend(
+                Path(entry.path)
+                for entry in song_dir_entries
+                if entry.name.startswith("00_")
+            )
+    return input_audio_paths
 
 
-def get_named_song_dirs() -> list[tuple[str, str]]:
+def _get_song_dir_state() -> tuple[int, ...]:
+    """
+    Get a tuple describing the current state of the intermediate audio
+    base directory.
+
+    The tuple contains the modification time of the base directory
+    followed by the modification times of each song directory within
+    it, so it changes whenever song directories are added or removed or
+    files within a song directory change.
+
+    Returns
+    -------
+    tuple[int, ...]
+        The modification times describing the current state of the
+        intermediate audio base directory.
+
+    """
+    try:
+        root_stat = os.stat(INTERMEDIATE_AUDIO_BASE_DIR)  # noqa: PTH116
+    except OSError:
+        return (-1,)
+    state = [root_stat.st_mtime_ns]
+    with os.scandir(INTERMEDIATE_AUDIO_BASE_DIR) as base_entries:
+        state.extend(
+            entry.stat().st_mtime_ns
+            for entry in base_entries
+            if entry.is_dir(follow_symlinks=False)
+        )
+    return tuple(state)
+
+
+# NOTE the state parameter is unused in the body; it keys the cache so
+# that the listing is recomputed when song directories change.
+@lru_cache(maxsize=1)
+def _get_named_song_dirs(_state: tuple[int, ...]) -> list[tuple[str, str]]:
     """
     Get the names of all saved songs and the paths to the
     directories where they are stored.
 
+    Parameters
+    ----------
+    _state : tuple[int, ...]
+        The modification times describing the current state of the
+        intermediate audio base directory, used as the cache key.
+
     Returns
     -------
     list[tuple[str, Path]]
@@ -240,6 +298,25 @@ def get_named_song_dirs() -> list[tuple[str, str]]:
     )
 
 
+def get_named_song_dirs() -> list[tuple[str, str]]:
+    """
+    Get the names of all saved songs and the paths to the
+    directories where they are stored.
+
+    The result is cached until the intermediate audio base directory
+    or any song directory within it changes, so repeated dropdown
+    refreshes do not rescan an unchanged directory tree.
+
+    Returns
+    -------
+    list[tuple[str, Path]]
+        A list of tuples containing the name of each saved song
+        and the path to the directory where it is stored.
+
+    """
+    return _get_named_song_dirs(_get_song_dir_state())
+
+
 def _get_model_name(
     effected_vocals_track: StrPath | None = None,
     song_dir: StrPath | None = None,
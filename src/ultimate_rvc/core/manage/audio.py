@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import os
 import shutil
 from pathlib import Path
 
@@ -23,6 +24,7 @@ from ultimate_rvc.core.exceptions import (
     UIMessage,
 )
 from ultimate_rvc.core.manage.common import (
+    cache_by_dir_mtime,
     delete_directory,
     get_items,
     get_named_items,
@@ -34,6 +36,7 @@ if TYPE_CHECKING:
     from ultimate_rvc.typing_extra import StrPath
 
 
+@cache_by_dir_mtime(OUTPUT_AUDIO_DIR)
 def get_saved_output_audio() -> list[tuple[str, str]]:
     """
     Get the name and path of all output audio files.
@@ -48,6 +51,7 @@ def get_saved_output_audio() -> list[tuple[str, str]]:
     return get_named_items(OUTPUT_AUDIO_DIR)
 
 
+@cache_by_dir_mtime(SPEECH_DIR)
 def get_saved_speech_audio() -> list[tuple[str, str]]:
     """
     Get the name and path of all speech audio files.
@@ -62,6 +66,7 @@ def get_saved_speech_audio() -> list[tuple[str, str]]:
     return get_named_items(SPEECH_DIR, exclude=".json")
 
 
+@cache_by_dir_mtime(TRAINING_AUDIO_DIR)
 def get_named_audio_datasets() -> list[tuple[str, str]]:
     """
     Get the name and path of all saved audio datasets.
@@ -76,6 +81,7 @@ def get_named_audio_datasets() -> list[tuple[str, str]]:
     return get_named_items(TRAINING_AUDIO_DIR)
 
 
+@cache_by_dir_mtime(TRAINING_AUDIO_DIR)
 def get_audio_datasets() -> list[str]:
     """
     Get the paths of all saved audio datasets.
@@ -131,21 +137,32 @@ def delete_audio(
     """
     if not items:
         raise NotProvidedError(entity=plural_entity, ui_msg=ui_msg)
+    dir_path = Path(directory)
+    # NOTE the provided directory is scanned once up front so that
+    # existence and type checks for each item do not require
+    # additional stat calls.
+    is_dir_map: dict[str, bool] = {}
+    if dir_path.is_dir():
+        with os.scandir(dir_path) as dir_entries:
+            is_dir_map = {entry.name: entry.is_dir() for entry in dir_entries}
     item_paths: list[Path] = []
     for item in items:
         item_path = Path(item)
-        if not item_path.exists():
-            raise NotFoundError(entity=singular_entity, location=item_path)
-        if item_path.parent != Path(directory):
+        if item_path.parent != dir_path:
+            if not item_path.exists():
+                raise NotFoundError(entity=singular_entity, location=item_path)
             raise InvalidLocationError(singular_entity, location, item_path)
+        if item_path.name not in is_dir_map:
+            raise NotFoundError(entity=singular_entity, location=item_path)
         item_paths.append(item_path)
     for item_path in item_paths:
-        if item_path.is_dir():
+        if is_dir_map[item_path.name]:
             shutil.rmtree(item_path)
         else:
             item_path.unlink()
             json_path = item_path.with_suffix(".json")
-            json_path.unlink(missing_ok=True)
+            if json_path.name in is_dir_map:
+                json_path.unlink(missing_ok=True)
 
 
 def delete_intermediate_audio(directories: Sequence[StrPath]) -> None:
@@ -7,14 +7,65 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-import operator
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
 from pathlib import Path
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from ultimate_rvc.typing_extra import StrPath
 
 
+def cache_by_dir_mtime[T](
+    directory: StrPath,
+) -> Callable[[Callable[[], T]], Callable[[], T]]:
+    """
+    Create a decorator which caches the result of a zero-argument
+    function until the modification time of the provided directory
+    changes.
+
+    The modification time of a directory changes whenever entries are
+    added to or removed from it, so functions listing the entries of
+    the directory are refreshed exactly when the listing changes.
+
+    Parameters
+    ----------
+    directory : StrPath
+        The path to the directory whose modification time keys the
+        cache.
+
+    Returns
+    -------
+    Callable[[Callable[[], T]], Callable[[], T]]
+        A decorator which caches the result of the decorated function
+        by the modification time of the provided directory.
+
+    """
+
+    def _decorator(fn: Callable[[], T]) -> Callable[[], T]:
+        cached_mtime: int | None = None
+        cached_result: T | None = None
+
+        @wraps(fn)
+        def _wrapped_fn() -> T:
+            nonlocal cached_mtime, cached_result
+            try:
+                mtime = os.stat(directory).st_mtime_ns  # noqa: PTH116
+            except OSError:
+                mtime = -1
+            if mtime != cached_mtime or cached_result is None:
+                cached_result = fn()
+                cached_mtime = mtime
+            return cached_result
+
+        return _wrapped_fn
+
+    return _decorator
+
+
 def get_named_items(
     directory: StrPath,
     exclude: str | None = None,
@@ -41,16 +92,21 @@ def get_named_items(
 
     """
     dir_path = Path(directory)
-    if dir_path.is_dir():
-        named_items = sorted(
-            [
-                (item_path.name if include_suffix else item_path.stem, str(item_path))
-                for item_path in dir_path.iterdir()
-                if item_path.suffix != exclude
-            ],
-        )
-        return sorted(named_items, key=operator.itemgetter(0))
-    return []
+    if not dir_path.is_dir():
+        return []
+    # NOTE os.scandir yields entry names and paths directly, avoiding
+    # the per-entry Path object construction of Path.iterdir.
+    named_items: list[tuple[str, str]] = []
+    with os.scandir(dir_path) as dir_entries:
+        for entry in dir_entries:
+            stem, suffix = os.path.splitext(entry.name)  # noqa: PTH122
+            if suffix == exclude:
+                continue
+            named_items.append(
+                (entry.name if include_suffix else stem, entry.path),
+            )
+    named_items.sort()
+    return named_items
 
 
 def get_items(
@@ -77,21 +133,43 @@ def get_items(
 
     """
     dir_path = Path(directory)
-    if dir_path.is_dir():
-        return sorted(
-            [
-                item_path.stem if only_stem else str(item_path)
-                for item_path in dir_path.iterdir()
-                if item_path.suffix != exclude
-            ],
-        )
-    return []
+    if not dir_path.is_dir():
+        return []
+    items: list[str] = []
+    with os.scandir(dir_path) as dir_entries:
+        for entry in dir_entries:
+            stem, suffix = os.path.splitext(entry.name)  # noqa: PTH122
+            if suffix == exclude:
+                continue
+            items.append(stem if only_stem else entry.path)
+    items.sort()
+    return items
+
+
+def _delete_entry(entry: os.DirEntry[str]) -> None:
+    """
+    Delete a single directory entry.
+
+    Parameters
+    ----------
+    entry : os.DirEntry[str]
+        The directory entry to delete.
+
+    """
+    if entry.is_dir(follow_symlinks=False):
+        shutil.rmtree(entry.path)
+    else:
+        os.unlink(entry.path)  # noqa: PTH108
 
 
 def delete_directory(path: StrPath) -> None:
     """
     Delete a directory and its contents if it exists.
 
+    The top-level entries of the directory are deleted in parallel
+    using a thread pool, as bulk deletion is I/O-bound and overlaps
+    well across threads.
+
     Parameters
     ----------
     path : str
@@ -99,5 +177,11 @@ def delete_directory(path: StrPath) -> None:
 
     """
     dir_path = Path(path)
-    if dir_path.is_dir():
-        shutil.rmtree(dir_path)
+    if not dir_path.is_dir():
+        return
+    with os.scandir(dir_path) as dir_entries:
+        entries = list(dir_entries)
+    if entries:
+        with ThreadPoolExecutor(max_workers=min(16, len(entries))) as executor:
+            list(executor.map(_delete_entry, entries))
+    dir_path.rmdir()
@@ -5,15 +5,24 @@ web application of the Ultimate RVC project.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Concatenate, ParamSpec, TypeVar
-
-from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Concatenate,
+    Literal,
+    ParamSpec,
+    TypeVar,
+    overload,
+)
+
+from functools import cache, partial
 
 import gradio as gr
 
+from ultimate_rvc.common import CONFIG_DIR
 from ultimate_rvc.core.exceptions import NotProvidedError
 from ultimate_rvc.core.manage.config import load_config, save_config
-from ultimate_rvc.web.config.main import TotalConfig
+from ultimate_rvc.web.config.main import TotalConfig, default_total_config
 from ultimate_rvc.web.typing_extra import SongTransferOption, SpeechTransferOption
 
 if TYPE_CHECKING:
@@ -41,31 +50,64 @@ P = ParamSpec("P")
 U = TypeVar("U", bound=SongTransferOption | SpeechTransferOption)
 
 
-def exception_harness(  # noqa: UP047
+@overload
+def harness(  # noqa: UP047
     fn: Callable[P, T],
+    *,
+    confirm: Literal[True],
     info_msg: str | None = None,
-) -> Callable[P, T]:
+) -> Callable[Concatenate[bool, P], T]: ...
+
+
+@overload
+def harness(  # noqa: UP047
+    fn: Callable[P, T],
+    *,
+    confirm: Literal[False] = False,
+    info_msg: str | None = None,
+) -> Callable[P, T]: ...
+
+
+def harness(  # noqa: UP047
+    fn: Callable[P, T],
+    *,
+    confirm: bool = False,
+    info_msg: str | None = None,
+) -> Callable[Concatenate[bool, P], T] | Callable[P, T]:
     """
     Wrap a function in a harness that catches exceptions and re-raises
     them as instances of `gradio.Error`.
 
+    The harness handles confirmation and exception translation in a
+    single wrapper so that each UI event pays for only one extra
+    function call.
+
     Parameters
     ----------
     fn : Callable[P, T]
         The function to wrap.
-
+    confirm : bool, default=False
+        Whether the wrapped function requires a confirmation before
+        executing. If True, the wrapped function expects a boolean
+        confirmation as its first argument.
     info_msg : str, optional
         Message to display in an info-box pop-up after the function
         executes successfully.
 
     Returns
     -------
-    Callable[P, T]
+    Callable[Concatenate[bool, P], T] | Callable[P, T]
         The wrapped function.
 
     """
 
-    def _wrapped_fn(*args: P.args, **kwargs: P.kwargs) -> T:
+    def _wrapped_fn(*args: Any, **kwargs: Any) -> T:  # noqa: ANN401
+        if confirm:
+            confirmation, *rest = args
+            if not confirmation:
+                err_msg = "Confirmation missing!"
+                raise gr.Error(err_msg)
+            args = tuple(rest)
         try:
             res = fn(*args, **kwargs)
         except gr.Error:
@@ -83,6 +125,32 @@ def exception_harness(  # noqa: UP047
     return _wrapped_fn
 
 
+def exception_harness(  # noqa: UP047
+    fn: Callable[P, T],
+    info_msg: str | None = None,
+) -> Callable[P, T]:
+    """
+    Wrap a function in a harness that catches exceptions and re-raises
+    them as instances of `gradio.Error`.
+
+    Parameters
+    ----------
+    fn : Callable[P, T]
+        The function to wrap.
+
+    info_msg : str, optional
+        Message to display in an info-box pop-up after the function
+        executes successfully.
+
+    Returns
+    -------
+    Callable[P, T]
+        The wrapped function.
+
+    """
+    return harness(fn, info_msg=info_msg)
+
+
 def confirmation_harness(  # noqa: UP047
     fn: Callable[P, T],
 ) -> Callable[Concatenate[bool, P], T]:
@@ -102,14 +170,7 @@ def confirmation_harness(  # noqa: UP047
         The wrapped function.
 
     """
-
-    def _wrapped_fn(confirm: bool, *args: P.args, **kwargs: P.kwargs) -> T:
-        if confirm:
-            return exception_harness(fn)(*args, **kwargs)
-        err_msg = "Confirmation missing!"
-        raise gr.Error(err_msg)
-
-    return _wrapped_fn
+    return harness(fn, confirm=True)
 
 
 def render_msg(
@@ -150,7 +211,10 @@ def confirm_box_js(msg: str) -> str:
     Generate a JavaScript code snippet which:
       * defines an anonymous function that takes one named parameter and
       zero or more unnamed parameters
-      * renders a confirmation box
+      * renders a confirmation box unless another confirmation box was
+      answered within the last 250 milliseconds, in which case the
+      click is treated as unconfirmed so that rapid repeat clicks
+      coalesce into a single server-side action
       * returns the choice selected by the user in that confirmation
       box in addition to any unnamed parameters passed to the function.
 
@@ -166,7 +230,16 @@ def confirm_box_js(msg: str) -> str:
         The JavaScript code snippet.
 
     """
-    return f"(x, ...args) => [confirm('{msg}'), ...args]"
+    return (
+        "(x, ...args) => {"
+        " const now = Date.now();"
+        " if (window._urvcLastConfirm && now - window._urvcLastConfirm < 250)"
+        " { return [false, ...args]; }"
+        f" const confirmed = confirm('{msg}');"
+        " window._urvcLastConfirm = Date.now();"
+        " return [confirmed, ...args];"
+        " }"
+    )
 
 
 def update_value(x: str | None) -> dict[str, Any]:
@@ -402,6 +475,41 @@ def initialize_dropdowns(
     return [gr.Dropdown(**update_args) for update_args in update_args_list]
 
 
+def update_dropdown(
+    fn: Callable[P, DropdownChoices],
+    value: DropdownValue = None,
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> gr.Dropdown:
+    """
+    Update the choices and value of a single dropdown component.
+
+    Specialized single-component counterpart of `update_dropdowns`
+    which skips the per-component loop and keyword-argument dictionary
+    construction on the dropdown-refresh path.
+
+    Parameters
+    ----------
+    fn : Callable[P, DropdownChoices]
+        Function to get updated choices for the dropdown component.
+    value : DropdownValue, optional
+        New value for the dropdown component.
+    args : P.args
+        Positional arguments to pass to the function used to update
+        dropdown choices.
+    kwargs : P.kwargs
+        Keyword arguments to pass to the function used to update
+        dropdown choices.
+
+    Returns
+    -------
+    gr.Dropdown
+        Updated dropdown component.
+
+    """
+    return gr.Dropdown(choices=fn(*args, **kwargs), value=value)
+
+
 def update_dropdowns(
     fn: Callable[P, DropdownChoices],
     num_components: int,
@@ -572,6 +680,28 @@ def update_audio(
             return tuple(gr.Audio(**update_args) for update_args in update_args_list)
 
 
+@cache
+def _get_transfer_choices(option_type: type[U]) -> tuple[U, ...]:  # noqa: UP047
+    """
+    Get the choices for a transfer option dropdown.
+
+    The members of each transfer option type are materialized once and
+    reused across all transfer dropdowns rendered with that type.
+
+    Parameters
+    ----------
+    option_type : type[U]
+        The type of the transfer options.
+
+    Returns
+    -------
+    tuple[U, ...]
+        The members of the provided transfer option type.
+
+    """
+    return tuple(option_type)
+
+
 def render_transfer_component(
     value: list[U],
     label_prefix: str,
@@ -596,7 +726,7 @@ def render_transfer_component(
 
     """
     return gr.Dropdown(
-        choices=list(option_type),
+        choices=_get_transfer_choices(option_type),
         label=f"{label_prefix} destination",
         info=(
             "Select the input track(s) to transfer the"
@@ -685,7 +815,7 @@ def setup_delete_event(
 
     """
     return button.click(
-        confirmation_harness(fn),
+        harness(fn, confirm=True),
         inputs=inputs,
         outputs=outputs,
         js=confirm_box_js(confirm_msg),
@@ -706,19 +836,29 @@ def save_total_config_values(name: str, *values: *tuple[Any, ...]) -> None:
         The component values to save to the total configuration model.
 
     """
-    new_config = TotalConfig()
+    new_config = default_total_config()
     for value, component_config in zip(values, new_config.all, strict=True):
         component_config.value = value
 
     save_config(name, new_config)
 
 
+# NOTE maps each configuration name to the modification time of its
+# file and the component values extracted from it, so that repeated
+# loads of an unchanged configuration skip JSON parsing and model
+# validation.
+_loaded_config_values: dict[str, tuple[int, tuple[Any, ...]]] = {}
+
+
 def load_total_config_values(name: str) -> tuple[Any, ...]:
     """
     Load a total configuration model from a JSON file with the provided
     name and return the non-excluded values of its nested component
     configurations.
 
+    The extracted values are cached by the modification time of the
+    configuration file, so loading the same unchanged configuration
+    again returns the cached values directly.
 
     Parameters
     ----------
@@ -733,5 +873,19 @@ def load_total_config_values(name: str) -> tuple[Any, ...]:
         in the loaded total configuration model.
 
     """
+    mtime: int | None = None
+    if name:
+        config_path = CONFIG_DIR / f"{name.strip()}.json"
+        try:
+            mtime = config_path.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        if mtime is not None:
+            cached = _loaded_config_values.get(name)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
     new_config = load_config(name, TotalConfig)
-    return tuple(c.value for c in new_config.all)
+    values = tuple(c.value for c in new_config.all)
+    if mtime is not None:
+        _loaded_config_values[name] = (mtime, values)
+    return values
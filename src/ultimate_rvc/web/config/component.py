@@ -7,6 +7,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar
 
+from functools import lru_cache
 from pathlib import Path
 
 from pydantic import (
@@ -216,10 +217,15 @@ class SliderConfig(InfoComponentConfig[float | None, gr.Slider]):
         )
 
     @classmethod
+    @lru_cache(maxsize=64)
     def octave_shift(cls, label: str, info: str) -> SliderConfig:
         """
         Create a slider configuration for octave pitch shift.
 
+        Results are cached so that repeated calls with the same
+        arguments return a single template instance, which pydantic
+        deep-copies when used as a field default.
+
         Parameters
         ----------
         label : str
@@ -236,10 +242,15 @@ class SliderConfig(InfoComponentConfig[float | None, gr.Slider]):
         return cls(label=label, info=info, value=0, minimum=-3, maximum=3, step=1)
 
     @classmethod
+    @lru_cache(maxsize=64)
     def semitone_shift(cls, label: str, info: str) -> SliderConfig:
         """
         Create a slider configuration for semitone pitch shift.
 
+        Results are cached so that repeated calls with the same
+        arguments return a single template instance, which pydantic
+        deep-copies when used as a field default.
+
         Parameters
         ----------
         label : str
@@ -680,10 +691,15 @@ class AudioConfig(ComponentConfig[str | Path | None, gr.Audio]):
         )
 
     @classmethod
+    @lru_cache(maxsize=64)
     def intermediate(cls, label: str) -> AudioConfig:
         """
         Create an intermediate audio configuration.
 
+        Results are cached so that repeated calls with the same label
+        return a single template instance, which pydantic deep-copies
+        when used as a field default.
+
         Returns
         -------
         AudioConfig
@@ -693,10 +709,15 @@ class AudioConfig(ComponentConfig[str | Path | None, gr.Audio]):
         return cls(label=label, value=None, exclude_value=True)
 
     @classmethod
+    @lru_cache(maxsize=64)
     def input(cls, label: str) -> AudioConfig:
         """
         Create an input audio configuration.
 
+        Results are cached so that repeated calls with the same label
+        return a single template instance, which pydantic deep-copies
+        when used as a field default.
+
         Returns
         -------
         AudioConfig
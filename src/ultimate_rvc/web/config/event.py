@@ -2,58 +2,62 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, ConfigDict, PrivateAttr
+from typing import TYPE_CHECKING
 
-from gradio.events import Dependency  # noqa: TC002
+from dataclasses import dataclass, field
 
 from ultimate_rvc.core.exceptions import EventNotInstantiatedError
 
+if TYPE_CHECKING:
+    from gradio.events import Dependency
 
-class ClickEvent(BaseModel):
+
+@dataclass(eq=False, slots=True)
+class ClickEvent:
     """
-    Model which represents a click event for a button in the UI.
+    Dataclass which represents a click event for a button in the UI.
+
+    Instances are slotted to cut per-instance memory, as many click
+    events are allocated each time the UI is rendered. Assignment of
+    the click event instance involves no pydantic validation.
 
     Attributes
     ----------
-    _instance : Dependency | None
-        Internal attribute storing the click event instance.
-        Will be null until a click event is assigned manually.
     instance : Dependency
-        The click event instance. Attempting to access this field
-        before manually assigning a click event will raise an
-        EventNotInstantiatedError.
+        The click event instance, stored as a plain slotted attribute
+        so that access involves no descriptor dispatch. Attempting to
+        access this attribute before manually assigning a click event
+        will raise an EventNotInstantiatedError.
 
     """
 
-    _instance: Dependency | None = PrivateAttr(default=None)
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    instance: Dependency = field(init=False, repr=False)
 
-    @property
-    def instance(self) -> Dependency:
+    def __getattr__(self, name: str) -> Dependency:
         """
-        Retrieve the click event instance.
+        Handle access to attributes that have not been assigned yet.
 
-        Returns
-        -------
-        Dependency
-            The click event instance.
+        Parameters
+        ----------
+        name : str
+            The name of the accessed attribute.
 
         Raises
         ------
         EventNotInstantiatedError
             If the click event instance has not been assigned yet.
+        AttributeError
+            If an attribute other than the click event instance is
+            accessed.
 
         """
-        if self._instance is None:
+        if name == "instance":
             raise EventNotInstantiatedError
-        return self._instance
-
-    @instance.setter
-    def instance(self, value: Dependency) -> None:
-        self._instance = value
+        raise AttributeError(name)
 
 
-class ManageAudioEventState(BaseModel):
+@dataclass(eq=False, slots=True)
+class ManageAudioEventState:
     """
     Event state of the audio management tab.
 
@@ -80,18 +84,19 @@ class ManageAudioEventState(BaseModel):
 
     """
 
-    delete_intermediate_click: ClickEvent = ClickEvent()
-    delete_all_intermediate_click: ClickEvent = ClickEvent()
-    delete_speech_click: ClickEvent = ClickEvent()
-    delete_all_speech_click: ClickEvent = ClickEvent()
-    delete_output_click: ClickEvent = ClickEvent()
-    delete_all_output_click: ClickEvent = ClickEvent()
-    delete_dataset_click: ClickEvent = ClickEvent()
-    delete_all_dataset_click: ClickEvent = ClickEvent()
-    delete_all_click: ClickEvent = ClickEvent()
+    delete_intermediate_click: ClickEvent = field(default_factory=ClickEvent)
+    delete_all_intermediate_click: ClickEvent = field(default_factory=ClickEvent)
+    delete_speech_click: ClickEvent = field(default_factory=ClickEvent)
+    delete_all_speech_click: ClickEvent = field(default_factory=ClickEvent)
+    delete_output_click: ClickEvent = field(default_factory=ClickEvent)
+    delete_all_output_click: ClickEvent = field(default_factory=ClickEvent)
+    delete_dataset_click: ClickEvent = field(default_factory=ClickEvent)
+    delete_all_dataset_click: ClickEvent = field(default_factory=ClickEvent)
+    delete_all_click: ClickEvent = field(default_factory=ClickEvent)
 
 
-class ManageModelEventState(BaseModel):
+@dataclass(eq=False, slots=True)
+class ManageModelEventState:
     """
     Event state of the model management tab.
 
@@ -126,17 +131,17 @@ class ManageModelEventState(BaseModel):
 
     """
 
-    download_voice_click: ClickEvent = ClickEvent()
-    upload_voice_click: ClickEvent = ClickEvent()
-    download_pretrained_click: ClickEvent = ClickEvent()
-    upload_embedder_click: ClickEvent = ClickEvent()
-
-    delete_voice_click: ClickEvent = ClickEvent()
-    delete_all_voices_click: ClickEvent = ClickEvent()
-    delete_embedder_click: ClickEvent = ClickEvent()
-    delete_all_embedders_click: ClickEvent = ClickEvent()
-    delete_pretrained_click: ClickEvent = ClickEvent()
-    delete_all_pretraineds_click: ClickEvent = ClickEvent()
-    delete_trained_click: ClickEvent = ClickEvent()
-    delete_all_trained_click: ClickEvent = ClickEvent()
-    delete_all_click: ClickEvent = ClickEvent()
+    download_voice_click: ClickEvent = field(default_factory=ClickEvent)
+    upload_voice_click: ClickEvent = field(default_factory=ClickEvent)
+    download_pretrained_click: ClickEvent = field(default_factory=ClickEvent)
+    upload_embedder_click: ClickEvent = field(default_factory=ClickEvent)
+
+    delete_voice_click: ClickEvent = field(default_factory=ClickEvent)
+    delete_all_voices_click: ClickEvent = field(default_factory=ClickEvent)
+    delete_embedder_click: ClickEvent = field(default_factory=ClickEvent)
+    delete_all_embedders_click: ClickEvent = field(default_factory=ClickEvent)
+    delete_pretrained_click: ClickEvent = field(default_factory=ClickEvent)
+    delete_all_pretraineds_click: ClickEvent = field(default_factory=ClickEvent)
+    delete_trained_click: ClickEvent = field(default_factory=ClickEvent)
+    delete_all_trained_click: ClickEvent = field(default_factory=ClickEvent)
+    delete_all_click: ClickEvent = field(default_factory=ClickEvent)
@@ -7,9 +7,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from functools import cached_property
-
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from ultimate_rvc.typing_extra import SegmentSize, SeparationModel
 from ultimate_rvc.web.config.component import (
@@ -31,7 +29,19 @@ if TYPE_CHECKING:
     import gradio as gr
 
 
-class SongIntermediateAudioConfig(BaseModel):
+class FrozenModel(BaseModel):
+    """
+    Base model for configuration models whose fields are frozen after
+    creation.
+
+    Freezing lets pydantic skip its copy-on-validate paths; the nested
+    component configuration models themselves remain mutable.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+
+class SongIntermediateAudioConfig(FrozenModel):
     """
     Configuration settings for intermediate audio components in the
     one-click song generation tab.
@@ -114,9 +124,19 @@ class SongIntermediateAudioConfig(BaseModel):
             the one-click song generation tab.
 
         """
-        # NOTE we are using self.__annotations__ to get the fields in
-        # the order they are defined in the class
-        return [getattr(self, field).instance for field in self.__annotations__]
+        return [
+            self.song.instance,
+            self.vocals.instance,
+            self.instrumentals.instance,
+            self.main_vocals.instance,
+            self.backup_vocals.instance,
+            self.main_vocals_dereverbed.instance,
+            self.main_vocals_reverb.instance,
+            self.converted_vocals.instance,
+            self.postprocessed_vocals.instance,
+            self.instrumentals_shifted.instance,
+            self.backup_vocals_shifted.instance,
+        ]
 
 
 class OneClickSongGenerationConfig(SongGenerationConfig):
@@ -169,7 +189,7 @@ class OneClickSongGenerationConfig(SongGenerationConfig):
     intermediate_audio: SongIntermediateAudioConfig = SongIntermediateAudioConfig()
 
 
-class SongInputAudioConfig(BaseModel):
+class SongInputAudioConfig(FrozenModel):
     """
     Configuration settings for input audio components in the multi-step
     song generation tab.
@@ -204,14 +224,21 @@ class SongInputAudioConfig(BaseModel):
 
     """
 
+    # NOTE fields with identical labels share a single prototype;
+    # pydantic deep-copies field defaults per instance, so this is
+    # safe.
+    _vocals_prototype = AudioConfig.input(label="Vocals")
+    _instrumentals_prototype = AudioConfig.input(label="Instrumentals")
+    _backup_vocals_prototype = AudioConfig.input(label="Backup vocals")
+
     audio: AudioConfig = AudioConfig.input(label="Audio")
-    vocals: AudioConfig = AudioConfig.input(label="Vocals")
-    converted_vocals: AudioConfig = AudioConfig.input(label="Vocals")
-    instrumentals: AudioConfig = AudioConfig.input(label="Instrumentals")
-    backup_vocals: AudioConfig = AudioConfig.input(label="Backup vocals")
+    vocals: AudioConfig = _vocals_prototype
+    converted_vocals: AudioConfig = _vocals_prototype
+    instrumentals: AudioConfig = _instrumentals_prototype
+    backup_vocals: AudioConfig = _backup_vocals_prototype
     main_vocals: AudioConfig = AudioConfig.input(label="Main vocals")
-    shifted_instrumentals: AudioConfig = AudioConfig.input(label="Instrumentals")
-    shifted_backup_vocals: AudioConfig = AudioConfig.input(label="Backup vocals")
+    shifted_instrumentals: AudioConfig = _instrumentals_prototype
+    shifted_backup_vocals: AudioConfig = _backup_vocals_prototype
 
     @property
     def all(self) -> list[AudioConfig]:
@@ -226,10 +253,19 @@ class SongInputAudioConfig(BaseModel):
             components in the multi-step song generation tab.
 
         """
-        return [getattr(self, field) for field in self.__annotations__]
+        return [
+            self.audio,
+            self.vocals,
+            self.converted_vocals,
+            self.instrumentals,
+            self.backup_vocals,
+            self.main_vocals,
+            self.shifted_instrumentals,
+            self.shifted_backup_vocals,
+        ]
 
 
-class SongDirsConfig(BaseModel):
+class SongDirsConfig(FrozenModel):
     """
     Configuration settings for song directory components in the
     multi-step song generation tab.
@@ -257,11 +293,15 @@ class SongDirsConfig(BaseModel):
 
     """
 
-    separate_audio: DropdownConfig = DropdownConfig.song_dir()
-    convert_vocals: DropdownConfig = DropdownConfig.song_dir()
-    postprocess_vocals: DropdownConfig = DropdownConfig.song_dir()
-    pitch_shift_background: DropdownConfig = DropdownConfig.song_dir()
-    mix: DropdownConfig = DropdownConfig.song_dir()
+    # NOTE a single prototype is shared across all fields; pydantic
+    # deep-copies field defaults per instance, so this is safe.
+    _song_dir_prototype = DropdownConfig.song_dir()
+
+    separate_audio: DropdownConfig = _song_dir_prototype
+    convert_vocals: DropdownConfig = _song_dir_prototype
+    postprocess_vocals: DropdownConfig = _song_dir_prototype
+    pitch_shift_background: DropdownConfig = _song_dir_prototype
+    mix: DropdownConfig = _song_dir_prototype
 
     @property
     def all(self) -> list[gr.Dropdown]:
@@ -276,7 +316,13 @@ class SongDirsConfig(BaseModel):
             the multi-step song generation tab.
 
         """
-        return [getattr(self, field).instance for field in self.__annotations__]
+        return [
+            self.separate_audio.instance,
+            self.convert_vocals.instance,
+            self.postprocess_vocals.instance,
+            self.pitch_shift_background.instance,
+            self.mix.instance,
+        ]
 
 
 class MultiStepSongGenerationConfig(SongGenerationConfig):
@@ -356,7 +402,7 @@ class MultiStepSongGenerationConfig(SongGenerationConfig):
     song_dirs: SongDirsConfig = SongDirsConfig()
 
 
-class SpeechIntermediateAudioConfig(BaseModel):
+class SpeechIntermediateAudioConfig(FrozenModel):
     """
     Configuration settings for intermediate audio components in the
     one-click speech generation tab.
@@ -389,7 +435,7 @@ class SpeechIntermediateAudioConfig(BaseModel):
             the speech generation tab.
 
         """
-        return [getattr(self, field).instance for field in self.__annotations__]
+        return [self.speech.instance, self.converted_speech.instance]
 
 
 class OneClickSpeechGenerationConfig(SpeechGenerationConfig):
@@ -422,7 +468,7 @@ class OneClickSpeechGenerationConfig(SpeechGenerationConfig):
     )
 
 
-class SpeechInputAudioConfig(BaseModel):
+class SpeechInputAudioConfig(FrozenModel):
     """
     Configuration settings for input audio components in the multi-step
     speech generation tab.
@@ -456,7 +502,7 @@ class SpeechInputAudioConfig(BaseModel):
             components in the multi-step speech generation tab.
 
         """
-        return [getattr(self, field) for field in self.__annotations__]
+        return [self.speech, self.converted_speech]
 
 
 class MultiStepSpeechGenerationConfig(SpeechGenerationConfig):
@@ -483,7 +529,7 @@ class MultiStepTrainingConfig(TrainingConfig):
     """Configuration settings for multi-step training tab."""
 
 
-class ModelManagementConfig(BaseModel):
+class ModelManagementConfig(FrozenModel):
     """
 
     Configuration settings for model management tab.
@@ -531,7 +577,7 @@ class ModelManagementConfig(BaseModel):
     )
 
 
-class AudioManagementConfig(BaseModel):
+class AudioManagementConfig(FrozenModel):
     """
     Configuration settings for audio management tab.
 
@@ -581,7 +627,7 @@ class AudioManagementConfig(BaseModel):
     )
 
 
-class SettingsManagementConfig(BaseModel):
+class SettingsManagementConfig(FrozenModel):
     """
     Configuration settings for settings management tab.
 
@@ -610,7 +656,7 @@ class SettingsManagementConfig(BaseModel):
     )
 
 
-class TotalSongGenerationConfig(BaseModel):
+class TotalSongGenerationConfig(FrozenModel):
     """
     All configuration settings for song generation tabs.
 
@@ -627,7 +673,7 @@ class TotalSongGenerationConfig(BaseModel):
     multi_step: MultiStepSongGenerationConfig = MultiStepSongGenerationConfig()
 
 
-class TotalSpeechGenerationConfig(BaseModel):
+class TotalSpeechGenerationConfig(FrozenModel):
     """
     All configuration settings for speech generation tabs.
 
@@ -644,7 +690,7 @@ class TotalSpeechGenerationConfig(BaseModel):
     multi_step: MultiStepSpeechGenerationConfig = MultiStepSpeechGenerationConfig()
 
 
-class TotalTrainingConfig(BaseModel):
+class TotalTrainingConfig(FrozenModel):
     """
     All configuration settings for training tabs.
 
@@ -658,7 +704,7 @@ class TotalTrainingConfig(BaseModel):
     multi_step: MultiStepTrainingConfig = MultiStepTrainingConfig()
 
 
-class TotalManagementConfig(BaseModel):
+class TotalManagementConfig(FrozenModel):
     """
     All configuration settings for management tabs.
 
@@ -678,7 +724,7 @@ class TotalManagementConfig(BaseModel):
     settings: SettingsManagementConfig = SettingsManagementConfig()
 
 
-class TotalConfig(BaseModel):
+class TotalConfig(FrozenModel):
     """
     All configuration settings for the Ultimate RVC app.
 
@@ -700,8 +746,36 @@ class TotalConfig(BaseModel):
     training: TotalTrainingConfig = TotalTrainingConfig()
     management: TotalManagementConfig = TotalManagementConfig()
 
-    @cached_property
-    def all(self) -> list[AnyComponentConfig]:
+    if TYPE_CHECKING:
+        all: tuple[AnyComponentConfig, ...]
+
+    # NOTE the signature, including the unused context parameter and
+    # its Any annotation, is dictated by pydantic.
+    def model_post_init(self, _context: Any, /) -> None:  # noqa: ANN401
+        """
+        Eagerly collect all non-excluded component configuration
+        models nested within the current model instance.
+
+        The collected models are stored as a flat tuple directly in
+        the instance dictionary so that subsequent accesses of the
+        `all` attribute are plain dictionary lookups and iteration
+        does not have to walk the nested models again.
+
+        Parameters
+        ----------
+        _context : Any
+            Additional context passed by pydantic during
+            initialization.
+
+        """
+        # NOTE writing through the instance dictionary bypasses the
+        # frozen-model guard; pyright models the dictionary as
+        # read-only and must be silenced here.
+        self.__dict__["all"] = (  # pyright: ignore[reportIndexIssue]
+            self._collect_all()
+        )
+
+    def _collect_all(self) -> tuple[AnyComponentConfig, ...]:
         """
         Recursively collect those component configuration models nested
         within the current model instance, which have values that are
@@ -709,10 +783,10 @@ class TotalConfig(BaseModel):
 
         Returns
         -------
-        list[AnyComponentConfig]
-            A list of component configuration models found within the
-            current model instance, which have values that are not
-            excluded.
+        tuple[AnyComponentConfig, ...]
+            A flat tuple of component configuration models found
+            within the current model instance, which have values that
+            are not excluded.
 
         """
 
@@ -726,4 +800,21 @@ class TotalConfig(BaseModel):
                     component_configs.extend(_collect(value))
             return component_configs
 
-        return _collect(self)
+        return tuple(_collect(self))
+
+
+def default_total_config() -> TotalConfig:
+    """
+    Create a total configuration model with default settings.
+
+    The model is created using `model_construct`, which skips
+    re-validation of the already validated default values of its
+    nested configuration models.
+
+    Returns
+    -------
+    TotalConfig
+        A total configuration model with default settings.
+
+    """
+    return TotalConfig.model_construct()
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from ultimate_rvc.typing_extra import (
     AudioExt,
@@ -41,6 +41,8 @@ class BaseTabConfig(BaseModel):
 
     """
 
+    model_config = ConfigDict(frozen=True)
+
     embedder_model: DropdownConfig = DropdownConfig(
         label="Embedder model",
         info="The model to use for generating speaker embeddings.",
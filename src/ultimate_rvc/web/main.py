@@ -34,7 +34,7 @@ from ultimate_rvc.core.manage.models import (
     get_voice_model_names,
 )
 from ultimate_rvc.web.common import initialize_dropdowns
-from ultimate_rvc.web.config.main import TotalConfig
+from ultimate_rvc.web.config.main import TotalConfig, default_total_config
 from ultimate_rvc.web.tabs.generate.song_cover.multi_step_generation import (
     render as render_song_cover_multi_step_tab,
 )
@@ -53,7 +53,9 @@ from ultimate_rvc.web.tabs.manage.settings import render as render_settings_tab
 
 config_name = os.environ.get("URVC_CONFIG")
 cookiefile = os.environ.get("YT_COOKIEFILE")
-total_config = load_config(config_name, TotalConfig) if config_name else TotalConfig()
+total_config = (
+    load_config(config_name, TotalConfig) if config_name else default_total_config()
+)
 
 
 def render_app() -> gr.Blocks:
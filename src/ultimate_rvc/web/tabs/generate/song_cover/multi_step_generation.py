@@ -29,6 +29,7 @@ from ultimate_rvc.web.common import (
     setup_transfer_event,
     toggle_visibility,
     toggle_visible_component,
+    update_dropdown,
     update_dropdowns,
     update_output_name,
     update_value,
@@ -156,7 +157,7 @@ def _render_step_0(total_config: TotalConfig, cookiefile: str | None) -> None:
             ],
             show_progress="hidden",
         ).then(
-            partial(update_dropdowns, get_named_song_dirs, 1, [], [0]),
+            partial(update_dropdown, get_named_song_dirs, []),
             outputs=total_config.management.audio.intermediate.instance,
             show_progress="hidden",
         )
@@ -660,7 +661,7 @@ def _render_step_5(
             ],
             outputs=song_cover_output,
         ).then(
-            partial(update_dropdowns, get_saved_output_audio, 1, [], [0]),
+            partial(update_dropdown, get_saved_output_audio, []),
             outputs=total_config.management.audio.output.instance,
             show_progress="hidden",
         )
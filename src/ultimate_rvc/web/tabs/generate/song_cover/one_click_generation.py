@@ -24,6 +24,7 @@ from ultimate_rvc.web.common import (
     toggle_intermediate_audio,
     toggle_visibility,
     toggle_visible_component,
+    update_dropdown,
     update_dropdowns,
     update_output_name,
     update_value,
@@ -118,7 +119,7 @@ def render(total_config: TotalConfig, cookiefile: str | None = None) -> None:
             ],
             show_progress="hidden",
         ).then(
-            partial(update_dropdowns, get_saved_output_audio, 1, [], [0]),
+            partial(update_dropdown, get_saved_output_audio, []),
             outputs=total_config.management.audio.output.instance,
             show_progress="hidden",
         )
@@ -29,7 +29,7 @@ from ultimate_rvc.web.common import (
     setup_transfer_event,
     toggle_visibility,
     toggle_visible_component,
-    update_dropdowns,
+    update_dropdown,
     update_output_name,
     update_value,
 )
@@ -133,7 +133,7 @@ def _render_step_1(total_config: TotalConfig) -> None:
             ],
             outputs=speech_track_output,
         ).then(
-            partial(update_dropdowns, get_saved_speech_audio, 1, [], [0]),
+            partial(update_dropdown, get_saved_speech_audio, []),
             outputs=total_config.management.audio.speech.instance,
             show_progress="hidden",
         )
@@ -278,7 +278,7 @@ def _render_step_2(total_config: TotalConfig) -> None:
             concurrency_id=ConcurrencyId.GPU,
             concurrency_limit=1,
         ).then(
-            partial(update_dropdowns, get_saved_speech_audio, 1, [], [0]),
+            partial(update_dropdown, get_saved_speech_audio, []),
             outputs=total_config.management.audio.speech.instance,
             show_progress="hidden",
         )
@@ -350,7 +350,7 @@ def _render_step_3(total_config: TotalConfig) -> None:
             ],
             outputs=mixed_speech_track_output,
         ).then(
-            partial(update_dropdowns, get_saved_output_audio, 1, [], [0]),
+            partial(update_dropdown, get_saved_output_audio, []),
             outputs=total_config.management.audio.output.instance,
             show_progress="hidden",
         )
@@ -24,12 +24,47 @@ from ultimate_rvc.core.manage.audio import (
     get_saved_output_audio,
     get_saved_speech_audio,
 )
-from ultimate_rvc.web.common import setup_delete_event, update_dropdowns
+from ultimate_rvc.web.common import (
+    setup_delete_event,
+    update_dropdown,
+    update_dropdowns,
+)
 from ultimate_rvc.web.config.event import ManageAudioEventState
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from ultimate_rvc.web.config.event import ClickEvent
     from ultimate_rvc.web.config.main import AudioManagementConfig, TotalConfig
 
+# NOTE confirmation and success messages for each delete accordion are
+# built once at import time so that every render reuses the same
+# string objects instead of re-formatting them.
+_INTERMEDIATE_DELETE_MSGS = (
+    "Are you sure you want to delete the selected song directories?",
+    "[-] Successfully deleted the selected song directories!",
+    "Are you sure you want to delete all intermediate audio files?",
+    "[-] Successfully deleted all intermediate audio files!",
+)
+_SPEECH_DELETE_MSGS = (
+    "Are you sure you want to delete the selected speech audio files?",
+    "[-] Successfully deleted the selected speech audio files!",
+    "Are you sure you want to delete all speech audio files?",
+    "[-] Successfully deleted all speech audio files!",
+)
+_OUTPUT_DELETE_MSGS = (
+    "Are you sure you want to delete the selected output audio files?",
+    "[-] Successfully deleted the selected output audio files!",
+    "Are you sure you want to delete all output audio files?",
+    "[-] Successfully deleted all output audio files!",
+)
+_DATASET_DELETE_MSGS = (
+    "Are you sure you want to delete the selected dataset audio files?",
+    "[-] Successfully deleted the selected dataset audio files!",
+    "Are you sure you want to delete all dataset audio files?",
+    "[-] Successfully deleted all dataset audio files!",
+)
+
 
 def render(total_config: TotalConfig) -> None:
     """
@@ -47,197 +82,179 @@ def render(total_config: TotalConfig) -> None:
     event_state = ManageAudioEventState()
 
     with gr.Tab("Delete"):
-        _render_intermediate_accordion(tab_config, event_state)
-        _render_speech_accordion(tab_config, event_state)
-        _render_output_accordion(tab_config, event_state)
-        _render_dataset_accordion(tab_config, event_state)
+        dummy_checkbox = tab_config.dummy_checkbox.instance
+        _render_delete_accordion(
+            "Intermediate audio",
+            dummy_checkbox,
+            tab_config.intermediate.instance,
+            event_state.delete_intermediate_click,
+            event_state.delete_all_intermediate_click,
+            delete_intermediate_audio,
+            delete_all_intermediate_audio,
+            _INTERMEDIATE_DELETE_MSGS,
+        )
+        _render_delete_accordion(
+            "Speech audio",
+            dummy_checkbox,
+            tab_config.speech.instance,
+            event_state.delete_speech_click,
+            event_state.delete_all_speech_click,
+            delete_speech_audio,
+            delete_all_speech_audio,
+            _SPEECH_DELETE_MSGS,
+        )
+        _render_delete_accordion(
+            "Output audio",
+            dummy_checkbox,
+            tab_config.output.instance,
+            event_state.delete_output_click,
+            event_state.delete_all_output_click,
+            delete_output_audio,
+            delete_all_output_audio,
+            _OUTPUT_DELETE_MSGS,
+        )
+        _render_delete_accordion(
+            "Dataset audio",
+            dummy_checkbox,
+            tab_config.dataset.instance,
+            event_state.delete_dataset_click,
+            event_state.delete_all_dataset_click,
+            delete_dataset_audio,
+            delete_all_dataset_audio,
+            _DATASET_DELETE_MSGS,
+        )
         _render_all_accordion(tab_config, event_state)
 
-        _, _, all_audio_update = [
-            click_event.success(
-                partial(
-                    update_dropdowns,
-                    get_named_song_dirs,
-                    3 + len(total_config.song.multi_step.song_dirs.all),
-                    [],
-                    [0],
-                ),
-                outputs=[
-                    tab_config.intermediate.instance,
-                    total_config.song.one_click.cached_song.instance,
-                    total_config.song.multi_step.cached_song.instance,
-                    *total_config.song.multi_step.song_dirs.all,
-                ],
-                show_progress="hidden",
-            )
-            for click_event in [
-                event_state.delete_intermediate_click.instance,
-                event_state.delete_all_intermediate_click.instance,
-                event_state.delete_all_click.instance,
-            ]
-        ]
-
-        _, _, all_audio_update = [
-            click_event.success(
-                partial(update_dropdowns, get_saved_speech_audio, 1, [], [0]),
-                outputs=tab_config.speech.instance,
-                show_progress="hidden",
-            )
-            for click_event in [
-                event_state.delete_speech_click.instance,
-                event_state.delete_all_speech_click.instance,
-                all_audio_update,
-            ]
-        ]
-
-        _, _, all_audio_update = [
-            click_event.success(
-                partial(update_dropdowns, get_saved_output_audio, 1, [], [0]),
-                outputs=tab_config.output.instance,
-                show_progress="hidden",
-            )
-            for click_event in [
-                event_state.delete_output_click.instance,
-                event_state.delete_all_output_click.instance,
-                all_audio_update,
-            ]
+        num_song_dir_components = 3 + len(total_config.song.multi_step.song_dirs.all)
+        refresh_audio_dropdowns = partial(
+            _update_audio_dropdowns,
+            num_song_dir_components,
+        )
+        audio_dropdown_outputs = [
+            tab_config.intermediate.instance,
+            total_config.song.one_click.cached_song.instance,
+            total_config.song.multi_step.cached_song.instance,
+            *total_config.song.multi_step.song_dirs.all,
+            tab_config.speech.instance,
+            tab_config.output.instance,
+            tab_config.dataset.instance,
+            total_config.training.multi_step.dataset.instance,
         ]
-
         for click_event in [
+            event_state.delete_intermediate_click.instance,
+            event_state.delete_all_intermediate_click.instance,
+            event_state.delete_speech_click.instance,
+            event_state.delete_all_speech_click.instance,
+            event_state.delete_output_click.instance,
+            event_state.delete_all_output_click.instance,
             event_state.delete_dataset_click.instance,
             event_state.delete_all_dataset_click.instance,
-            all_audio_update,
+            event_state.delete_all_click.instance,
         ]:
             click_event.success(
-                partial(update_dropdowns, get_named_audio_datasets, 1, [], [0]),
-                outputs=tab_config.dataset.instance,
-                show_progress="hidden",
-            ).then(
-                partial(update_dropdowns, get_audio_datasets, 1, [], [0]),
-                outputs=total_config.training.multi_step.dataset.instance,
+                refresh_audio_dropdowns,
+                outputs=audio_dropdown_outputs,
                 show_progress="hidden",
             )
 
 
-def _render_intermediate_accordion(
-    tab_config: AudioManagementConfig,
-    event_state: ManageAudioEventState,
-) -> None:
-    with gr.Accordion("Intermediate audio", open=False), gr.Row():
-        with gr.Column():
-            tab_config.intermediate.instance.render()
-            intermediate_audio_btn = gr.Button("Delete selected", variant="secondary")
-            all_intermediate_audio_btn = gr.Button("Delete all", variant="primary")
-        with gr.Column():
-            intermediate_audio_msg = gr.Textbox(
-                label="Output message",
-                interactive=False,
-            )
-        event_state.delete_intermediate_click.instance = setup_delete_event(
-            intermediate_audio_btn,
-            delete_intermediate_audio,
-            [tab_config.dummy_checkbox.instance, tab_config.intermediate.instance],
-            intermediate_audio_msg,
-            "Are you sure you want to delete the selected song directories?",
-            "[-] Successfully deleted the selected song directories!",
-        )
-        event_state.delete_all_intermediate_click.instance = setup_delete_event(
-            all_intermediate_audio_btn,
-            delete_all_intermediate_audio,
-            [tab_config.dummy_checkbox.instance],
-            intermediate_audio_msg,
-            "Are you sure you want to delete all intermediate audio files?",
-            "[-] Successfully deleted all intermediate audio files!",
-        )
+def _update_audio_dropdowns(num_song_dir_components: int) -> tuple[gr.Dropdown, ...]:
+    """
+    Update the choices of all audio dropdown components in a single
+    pass.
 
+    Refreshing every dropdown in one handler replaces the chains of
+    per-dropdown success handlers, so deleting audio triggers a single
+    server roundtrip instead of one per dropdown group.
 
-def _render_speech_accordion(
-    tab_config: AudioManagementConfig,
-    event_state: ManageAudioEventState,
-) -> None:
-    with gr.Accordion("Speech audio", open=False), gr.Row():
-        with gr.Column():
-            tab_config.speech.instance.render()
-            speech_audio_btn = gr.Button("Delete selected", variant="secondary")
-            all_speech_audio_btn = gr.Button("Delete all", variant="primary")
-        with gr.Column():
-            speech_audio_msg = gr.Textbox(label="Output message", interactive=False)
+    Parameters
+    ----------
+    num_song_dir_components : int
+        Number of song directory dropdown components to update.
 
-        event_state.delete_speech_click.instance = setup_delete_event(
-            speech_audio_btn,
-            delete_speech_audio,
-            [tab_config.dummy_checkbox.instance, tab_config.speech.instance],
-            speech_audio_msg,
-            "Are you sure you want to delete the selected speech audio files?",
-            "[-] Successfully deleted the selected speech audio files!",
-        )
+    Returns
+    -------
+    tuple[gr.Dropdown, ...]
+        Updated audio dropdown components.
 
-        event_state.delete_all_speech_click.instance = setup_delete_event(
-            all_speech_audio_btn,
-            delete_all_speech_audio,
-            [tab_config.dummy_checkbox.instance],
-            speech_audio_msg,
-            "Are you sure you want to delete all speech audio files?",
-            "[-] Successfully deleted all speech audio files!",
-        )
+    """
+    song_dir_updates = update_dropdowns(
+        get_named_song_dirs,
+        num_song_dir_components,
+        [],
+        [0],
+    )
+    if isinstance(song_dir_updates, gr.Dropdown):
+        song_dir_updates = (song_dir_updates,)
+    return (
+        *song_dir_updates,
+        update_dropdown(get_saved_speech_audio, []),
+        update_dropdown(get_saved_output_audio, []),
+        update_dropdown(get_named_audio_datasets, []),
+        update_dropdown(get_audio_datasets, []),
+    )
 
 
-def _render_output_accordion(
-    tab_config: AudioManagementConfig,
-    event_state: ManageAudioEventState,
+def _render_delete_accordion(
+    title: str,
+    dummy_checkbox: gr.Checkbox,
+    dropdown: gr.Dropdown,
+    delete_click: ClickEvent,
+    delete_all_click: ClickEvent,
+    delete_fn: Callable[..., None],
+    delete_all_fn: Callable[..., None],
+    messages: tuple[str, str, str, str],
 ) -> None:
-    with gr.Accordion("Output audio", open=False), gr.Row():
-        with gr.Column():
-            tab_config.output.instance.render()
-            output_audio_btn = gr.Button("Delete selected", variant="secondary")
-            all_output_audio_btn = gr.Button("Delete all", variant="primary")
-        with gr.Column():
-            output_audio_msg = gr.Textbox(label="Output message", interactive=False)
-        event_state.delete_output_click.instance = setup_delete_event(
-            output_audio_btn,
-            delete_output_audio,
-            [tab_config.dummy_checkbox.instance, tab_config.output.instance],
-            output_audio_msg,
-            "Are you sure you want to delete the selected output audio files?",
-            "[-] Successfully deleted the selected output audio files!",
-        )
-        event_state.delete_all_output_click.instance = setup_delete_event(
-            all_output_audio_btn,
-            delete_all_output_audio,
-            [tab_config.dummy_checkbox.instance],
-            output_audio_msg,
-            "Are you sure you want to delete all output audio files?",
-            "[-] Successfully deleted all output audio files!",
-        )
+    """
+    Render an accordion for deleting a category of audio items.
 
+    Parameters
+    ----------
+    title : str
+        Title of the accordion.
+    dummy_checkbox : gr.Checkbox
+        Dummy checkbox component used to trigger confirmation pop-ups.
+    dropdown : gr.Dropdown
+        Dropdown component for selecting audio items to delete.
+    delete_click : ClickEvent
+        Click event to assign the delete-selected event to.
+    delete_all_click : ClickEvent
+        Click event to assign the delete-all event to.
+    delete_fn : Callable[..., None]
+        Function to call to delete the selected audio items.
+    delete_all_fn : Callable[..., None]
+        Function to call to delete all audio items in the category.
+    messages : tuple[str, str, str, str]
+        Confirmation and success messages for deleting the selected
+        audio items followed by confirmation and success messages for
+        deleting all audio items in the category.
 
-def _render_dataset_accordion(
-    tab_config: AudioManagementConfig,
-    event_state: ManageAudioEventState,
-) -> None:
-    with gr.Accordion("Dataset audio", open=False), gr.Row():
+    """
+    confirm_selected_msg, success_selected_msg, confirm_all_msg, success_all_msg = (
+        messages
+    )
+    with gr.Accordion(title, open=False), gr.Row():
         with gr.Column():
-            tab_config.dataset.instance.render()
-            dataset_audio_btn = gr.Button("Delete selected", variant="secondary")
-            all_dataset_audio_btn = gr.Button("Delete all", variant="primary")
+            dropdown.render()
+            delete_btn = gr.Button("Delete selected", variant="secondary")
+            delete_all_btn = gr.Button("Delete all", variant="primary")
         with gr.Column():
-            dataset_audio_msg = gr.Textbox(label="Output message", interactive=False)
-
-        event_state.delete_dataset_click.instance = setup_delete_event(
-            dataset_audio_btn,
-            delete_dataset_audio,
-            [tab_config.dummy_checkbox.instance, tab_config.dataset.instance],
-            dataset_audio_msg,
-            "Are you sure you want to delete the selected dataset audio files?",
-            "[-] Successfully deleted the selected dataset audio files!",
+            output_msg = gr.Textbox(label="Output message", interactive=False)
+        delete_click.instance = setup_delete_event(
+            delete_btn,
+            delete_fn,
+            [dummy_checkbox, dropdown],
+            output_msg,
+            confirm_selected_msg,
+            success_selected_msg,
         )
-        event_state.delete_all_dataset_click.instance = setup_delete_event(
-            all_dataset_audio_btn,
-            delete_all_dataset_audio,
-            [tab_config.dummy_checkbox.instance],
-            dataset_audio_msg,
-            "Are you sure you want to delete all dataset audio files?",
-            "[-] Successfully deleted all dataset audio files!",
+        delete_all_click.instance = setup_delete_event(
+            delete_all_btn,
+            delete_all_fn,
+            [dummy_checkbox],
+            output_msg,
+            confirm_all_msg,
+            success_all_msg,
         )
 
 
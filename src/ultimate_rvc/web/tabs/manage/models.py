@@ -50,6 +50,32 @@ from ultimate_rvc.web.tabs.train.multi_step_generation import (
 if TYPE_CHECKING:
     from ultimate_rvc.web.config.main import ModelManagementConfig, TotalConfig
 
+# NOTE the dropdown refresh handlers are shared across several click
+# events, so they are allocated once at module level rather than once
+# per click event each time the UI is rendered.
+_refresh_voice_models = partial(update_dropdowns, get_voice_model_names, 5, [], [4])
+_refresh_embedder_models = partial(
+    update_dropdowns,
+    get_custom_embedder_model_names,
+    6,
+    [],
+    [5],
+)
+_refresh_pretrained_models = partial(
+    update_dropdowns,
+    get_custom_pretrained_model_names,
+    2,
+    [],
+    [1],
+)
+_refresh_training_models = partial(
+    update_dropdowns,
+    get_training_model_names,
+    4,
+    [],
+    [0, 3],
+)
+
 
 def render(total_config: TotalConfig) -> None:
     """
@@ -75,7 +101,7 @@ def render(total_config: TotalConfig) -> None:
 
     *_, all_model_update = [
         click_event.success(
-            partial(update_dropdowns, get_voice_model_names, 5, [], [4]),
+            _refresh_voice_models,
             outputs=[
                 total_config.song.one_click.voice_model.instance,
                 total_config.song.multi_step.voice_model.instance,
@@ -96,7 +122,7 @@ def render(total_config: TotalConfig) -> None:
 
     *_, all_model_update = [
         click_event.success(
-            partial(update_dropdowns, get_custom_embedder_model_names, 6, [], [5]),
+            _refresh_embedder_models,
             outputs=[
                 total_config.song.one_click.custom_embedder_model.instance,
                 total_config.song.multi_step.custom_embedder_model.instance,
@@ -117,7 +143,7 @@ def render(total_config: TotalConfig) -> None:
 
     *_, all_model_update = [
         click_event.success(
-            partial(update_dropdowns, get_custom_pretrained_model_names, 2, [], [1]),
+            _refresh_pretrained_models,
             outputs=[
                 total_config.training.multi_step.custom_pretrained_model.instance,
                 tab_config.pretraineds.instance,
@@ -138,7 +164,7 @@ def render(total_config: TotalConfig) -> None:
         all_model_update,
     ]:
         click_event.success(
-            partial(update_dropdowns, get_training_model_names, 4, [], [0, 3]),
+            _refresh_training_models,
             outputs=[
                 total_config.training.multi_step.preprocess_model.instance,
                 total_config.training.multi_step.extract_model.instance,
@@ -385,9 +411,11 @@ def _render_voices_accordion(
     tab_config: ModelManagementConfig,
     event_state: ManageModelEventState,
 ) -> None:
+    dummy_checkbox = tab_config.dummy_checkbox.instance
+    voices = tab_config.voices.instance
     with gr.Accordion("Voice models", open=False), gr.Row():
         with gr.Column():
-            tab_config.voices.instance.render()
+            voices.render()
             delete_voice_btn = gr.Button("Delete selected", variant="secondary")
             delete_all_voice_btn = gr.Button("Delete all", variant="primary")
         with gr.Column():
@@ -396,7 +424,7 @@ def _render_voices_accordion(
     event_state.delete_voice_click.instance = setup_delete_event(
         delete_voice_btn,
         delete_voice_models,
-        [tab_config.dummy_checkbox.instance, tab_config.voices.instance],
+        [dummy_checkbox, voices],
         delete_voice_msg,
         "Are you sure you want to delete the selected voice models?",
         "[-] Successfully deleted selected voice models!",
@@ -405,7 +433,7 @@ def _render_voices_accordion(
     event_state.delete_all_voices_click.instance = setup_delete_event(
         delete_all_voice_btn,
         delete_all_voice_models,
-        [tab_config.dummy_checkbox.instance],
+        [dummy_checkbox],
         delete_voice_msg,
         "Are you sure you want to delete all voice models?",
         "[-] Successfully deleted all voice models!",
@@ -416,9 +444,11 @@ def _render_embedders_accordion(
     tab_config: ModelManagementConfig,
     event_state: ManageModelEventState,
 ) -> None:
+    dummy_checkbox = tab_config.dummy_checkbox.instance
+    embedders = tab_config.embedders.instance
     with gr.Accordion("Custom embedder models", open=False), gr.Row():
         with gr.Column():
-            tab_config.embedders.instance.render()
+            embedders.render()
             delete_embedder_btn = gr.Button("Delete selected", variant="secondary")
             delete_all_embedder_btn = gr.Button("Delete all", variant="primary")
         with gr.Column():
@@ -427,7 +457,7 @@ def _render_embedders_accordion(
     event_state.delete_embedder_click.instance = setup_delete_event(
         delete_embedder_btn,
         delete_custom_embedder_models,
-        [tab_config.dummy_checkbox.instance, tab_config.embedders.instance],
+        [dummy_checkbox, embedders],
         delete_embedder_msg,
         "Are you sure you want to delete the selected custom embedder models?",
         "[-] Successfully deleted selected custom embedder models!",
@@ -436,7 +466,7 @@ def _render_embedders_accordion(
     event_state.delete_all_embedders_click.instance = setup_delete_event(
         delete_all_embedder_btn,
         delete_all_custom_embedder_models,
-        [tab_config.dummy_checkbox.instance],
+        [dummy_checkbox],
         delete_embedder_msg,
         "Are you sure you want to delete all custom embedder models?",
         "[-] Successfully deleted all custom embedder models!",
@@ -447,9 +477,11 @@ def _render_pretraineds_accordion(
     tab_config: ModelManagementConfig,
     event_state: ManageModelEventState,
 ) -> None:
+    dummy_checkbox = tab_config.dummy_checkbox.instance
+    pretraineds = tab_config.pretraineds.instance
     with gr.Accordion("Custom pretrained models", open=False), gr.Row():
         with gr.Column():
-            tab_config.pretraineds.instance.render()
+            pretraineds.render()
             delete_pretrained_btn = gr.Button("Delete selected", variant="secondary")
             delete_all_pretrained_btn = gr.Button("Delete all", variant="primary")
         with gr.Column():
@@ -461,7 +493,7 @@ def _render_pretraineds_accordion(
     event_state.delete_pretrained_click.instance = setup_delete_event(
         delete_pretrained_btn,
         delete_custom_pretrained_models,
-        [tab_config.dummy_checkbox.instance, tab_config.pretraineds.instance],
+        [dummy_checkbox, pretraineds],
         delete_pretrained_msg,
         "Are you sure you want to delete the selected custom pretrained models?",
         "[-] Successfully deleted selected custom pretrained models!",
@@ -469,7 +501,7 @@ def _render_pretraineds_accordion(
     event_state.delete_all_pretraineds_click.instance = setup_delete_event(
         delete_all_pretrained_btn,
         delete_all_custom_pretrained_models,
-        [tab_config.dummy_checkbox.instance],
+        [dummy_checkbox],
         delete_pretrained_msg,
         "Are you sure you want to delete all custom pretrained models?",
         "[-] Successfully deleted all custom pretrained models!",
@@ -480,9 +512,11 @@ def _render_traineds_accordion(
     tab_config: ModelManagementConfig,
     event_state: ManageModelEventState,
 ) -> None:
+    dummy_checkbox = tab_config.dummy_checkbox.instance
+    traineds = tab_config.traineds.instance
     with gr.Accordion("Training models", open=False), gr.Row():
         with gr.Column():
-            tab_config.traineds.instance.render()
+            traineds.render()
             delete_train_btn = gr.Button("Delete selected", variant="secondary")
             delete_all_train_btn = gr.Button("Delete all", variant="primary")
         with gr.Column():
@@ -491,7 +525,7 @@ def _render_traineds_accordion(
     event_state.delete_trained_click.instance = setup_delete_event(
         delete_train_btn,
         delete_training_models,
-        [tab_config.dummy_checkbox.instance, tab_config.traineds.instance],
+        [dummy_checkbox, traineds],
         delete_train_msg,
         "Are you sure you want to delete the selected training models?",
         "[-] Successfully deleted selected training models!",
@@ -500,7 +534,7 @@ def _render_traineds_accordion(
     event_state.delete_all_trained_click.instance = setup_delete_event(
         delete_all_train_btn,
         delete_all_training_models,
-        [tab_config.dummy_checkbox.instance],
+        [dummy_checkbox],
         delete_train_msg,
         "Are you sure you want to delete all training models?",
         "[-] Successfully deleted all training models!",
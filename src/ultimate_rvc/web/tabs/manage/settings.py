@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import asyncio
 from functools import partial
 
 import gradio as gr
@@ -16,12 +17,12 @@ from ultimate_rvc.core.manage.config import (
 from ultimate_rvc.core.manage.settings import delete_temp_files
 from ultimate_rvc.web.common import (
     confirm_box_js,
-    confirmation_harness,
-    exception_harness,
+    harness,
     load_total_config_values,
     render_msg,
     save_total_config_values,
     setup_delete_event,
+    update_dropdown,
     update_dropdowns,
 )
 
@@ -75,7 +76,7 @@ def _render_config_files_tab(
                 load_config_msg = gr.Textbox(label="Output message", interactive=False)
 
         save_config_btn.click(
-            exception_harness(save_total_config_values),
+            harness(save_total_config_values),
             inputs=[save_config_name, *components],
             outputs=save_config_msg,
         ).success(
@@ -83,18 +84,18 @@ def _render_config_files_tab(
             outputs=save_config_msg,
             show_progress="hidden",
         ).then(
-            partial(update_dropdowns, get_config_names, 1, value_indices=[0]),
+            partial(update_dropdown, get_config_names),
             inputs=save_config_name,
             outputs=tab_config.load_config_name.instance,
             show_progress="hidden",
         ).then(
-            partial(update_dropdowns, get_config_names, 1, [], [0]),
+            partial(update_dropdown, get_config_names, []),
             outputs=tab_config.delete_config_names.instance,
             show_progress="hidden",
         )
 
         load_config_btn.click(
-            exception_harness(load_total_config_values),
+            harness(load_total_config_values),
             inputs=tab_config.load_config_name.instance,
             outputs=components,
             show_progress_on=load_config_msg,
@@ -145,6 +146,23 @@ def _render_config_files_tab(
             )
 
 
+async def _delete_temp_files(confirm: bool) -> None:
+    """
+    Delete all temporary files in a worker thread.
+
+    Running the deletion in a worker thread keeps the Gradio event
+    loop responsive while potentially many temporary files are
+    removed.
+
+    Parameters
+    ----------
+    confirm : bool
+        Whether the deletion has been confirmed.
+
+    """
+    await asyncio.to_thread(harness(delete_temp_files, confirm=True), confirm)
+
+
 def _render_temp_files_tab(tab_config: SettingsManagementConfig) -> None:
     with gr.Tab("Temporary files"):
         gr.Markdown("")
@@ -153,7 +171,7 @@ def _render_temp_files_tab(tab_config: SettingsManagementConfig) -> None:
             temporary_files_msg = gr.Textbox(label="Output message", interactive=False)
 
         temporary_files_btn.click(
-            confirmation_harness(delete_temp_files),
+            _delete_temp_files,
             inputs=tab_config.dummy_checkbox.instance,
             outputs=temporary_files_msg,
             js=confirm_box_js(
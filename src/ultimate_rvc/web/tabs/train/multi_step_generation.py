@@ -38,6 +38,7 @@ from ultimate_rvc.web.common import (
     toggle_visibilities,
     toggle_visibility,
     toggle_visible_component,
+    update_dropdown,
     update_dropdowns,
     update_value,
 )
@@ -108,13 +109,12 @@ def _render_step_1(total_config: TotalConfig) -> None:
             outputs=audio_files,
             show_progress="hidden",
         ).then(
-            partial(update_dropdowns, get_audio_datasets, 1, value_indices=[0]),
+            _update_dataset_dropdowns,
             inputs=current_dataset,
-            outputs=tab_config.dataset.instance,
-            show_progress="hidden",
-        ).then(
-            partial(update_dropdowns, get_named_audio_datasets, 1, [], [0]),
-            outputs=total_config.management.audio.dataset.instance,
+            outputs=[
+                tab_config.dataset.instance,
+                total_config.management.audio.dataset.instance,
+            ],
             show_progress="hidden",
         )
         with gr.Row():
@@ -575,6 +575,33 @@ def _toggle_dataset_input(
     )
 
 
+def _update_dataset_dropdowns(dataset: str) -> tuple[gr.Dropdown, gr.Dropdown]:
+    """
+    Update the choices of the dataset dropdown components in a single
+    pass.
+
+    Combining both updates in one handler replaces the chain of
+    per-dropdown handlers, so populating a dataset triggers a single
+    server roundtrip instead of two sequential ones.
+
+    Parameters
+    ----------
+    dataset : str
+        The path of the dataset to select in the training dataset
+        dropdown component.
+
+    Returns
+    -------
+    tuple[gr.Dropdown, gr.Dropdown]
+        The updated dataset dropdown components.
+
+    """
+    return (
+        update_dropdown(get_audio_datasets, dataset),
+        update_dropdown(get_named_audio_datasets, []),
+    )
+
+
 def _normalize_and_update(value: str) -> gr.Dropdown:
     """
     Normalize the value of the given string and update the dropdown.
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 from typing import Any, TypedDict
 
+import sys
 from collections.abc import Callable, Sequence
 from enum import StrEnum, auto
 
@@ -133,3 +134,24 @@ class DatasetType(StrEnum):
 
     NEW_DATASET = "New dataset"
     EXISTING_DATASET = "Existing dataset"
+
+
+def _intern_choice_values() -> None:
+    """
+    Intern the values of the enumerations defined in this module.
+
+    The values are compared against raw strings received from the
+    browser on every Gradio event; interning them up front speeds up
+    the comparisons.
+    """
+    for member in (
+        *SongSourceType,
+        *SpeechSourceType,
+        *SongTransferOption,
+        *SpeechTransferOption,
+        *DatasetType,
+    ):
+        sys.intern(member.value)
+
+
+_intern_choice_values()
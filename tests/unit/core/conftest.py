@@ -0,0 +1,56 @@
+"""Shared fixtures for unit tests of the ultimate_rvc.core package."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import shutil
+
+import pytest
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture(scope="session")
+def voice_models_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Create a pristine template voice model directory once per test
+    session.
+
+    Parameters
+    ----------
+    tmp_path_factory : pytest.TempPathFactory
+        Factory for session-scoped temporary directories.
+
+    Returns
+    -------
+    Path
+        The path to the template voice model directory.
+
+    """
+    template_dir = tmp_path_factory.mktemp("template") / "voice_models"
+    template_dir.mkdir()
+    return template_dir
+
+
+@pytest.fixture
+def voice_models_dir(tmp_path: Path, voice_models_template: Path) -> Path:
+    """
+    Copy the pristine template voice model directory into the current
+    test's temporary directory.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        The temporary directory of the current test.
+    voice_models_template : Path
+        The session-scoped template voice model directory.
+
+    Returns
+    -------
+    Path
+        The path to the copied voice model directory.
+
+    """
+    return shutil.copytree(voice_models_template, tmp_path / "voice_models")
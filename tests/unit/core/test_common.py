@@ -50,8 +50,6 @@ from ultimate_rvc.core.exceptions import (
 if TYPE_CHECKING:
     from typing import Any
 
-    import pytest_mock
-
 
 # Constants for hash sizes in hex characters (bytes * 2)
 DEFAULT_HASH_SIZE = 10  # 5 bytes * 2
@@ -62,6 +60,59 @@ LARGE_HASH_SIZE = 20  # 10 bytes * 2
 EXPECTED_FILE_SIZE = 1024
 EXPECTED_LARGE_FILE_SIZE = 2048
 
+# URL cases shared by the parametrized validate_url tests; built once
+# at import as immutable tuples.
+VALID_URLS = (
+    "http://example.com",
+    "https://example.com",
+    "http://example.com/model.zip",
+    "https://example.com/model.zip",
+    "https://api.example.com/v1/models/download?id=123&format=zip",
+    "http://subdomain.example.com/path",
+    "https://example.com:8080/api/v1",
+    "http://192.168.1.1/file.zip",
+    "https://example.com/path?query=value&other=123",
+    "http://example.com/path#fragment",
+)
+VALID_URL_IDS = (
+    "http",
+    "https",
+    "http-file",
+    "https-file",
+    "api-query",
+    "subdomain",
+    "port",
+    "ip",
+    "query",
+    "fragment",
+)
+INVALID_URLS = (
+    "ftp://example.com",
+    "ftp://example.com/file.zip",
+    "not-a-url",
+    "example.com/model.zip",
+    "file:///path/to/file",
+    "mailto:user@example.com",
+    "javascript:alert('xss')",
+    "//example.com",  # Protocol-relative
+    "example.com",  # Missing protocol
+    "http://",  # Incomplete
+    "not a url at all",
+)
+INVALID_URL_IDS = (
+    "ftp",
+    "ftp-file",
+    "malformed",
+    "missing-protocol-file",
+    "file-scheme",
+    "mailto",
+    "javascript",
+    "protocol-relative",
+    "missing-protocol",
+    "incomplete",
+    "spaces",
+)
+
 
 class TestConstants:
     """Test that module constants are correctly defined."""
@@ -675,66 +726,86 @@ class TestGetFileSize:
     EXPECTED_LARGE_FILE_SIZE = 2048
 
     @pytest.mark.network
-    def test_get_file_size_success(self, mocker: pytest_mock.MockerFixture) -> None:
+    def test_get_file_size_success(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test get_file_size with successful HTTP response."""
-        mock_response = mocker.MagicMock()
+        mock_response = MagicMock()
         mock_response.headers = {"content-length": str(EXPECTED_FILE_SIZE)}
-        mock_requests = mocker.patch("ultimate_rvc.core.common.requests")
-        mock_requests.head.return_value = mock_response
+        mock_session = MagicMock()
+        monkeypatch.setattr(
+            "ultimate_rvc.core.common._get_http_session",
+            lambda: mock_session,
+        )
+        mock_session.head.return_value = mock_response
 
         result = get_file_size("https://example.com/file.zip")
 
         assert result == EXPECTED_FILE_SIZE
-        mock_requests.head.assert_called_once_with(
+        mock_session.head.assert_called_once_with(
             "https://example.com/file.zip", timeout=10
         )
 
     @pytest.mark.network
     def test_get_file_size_no_content_length(
-        self, mocker: pytest_mock.MockerFixture
+        self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Test get_file_size when content-length header is missing."""
-        mock_response = mocker.MagicMock()
+        mock_response = MagicMock()
         mock_response.headers = {}
-        mock_requests = mocker.patch("ultimate_rvc.core.common.requests")
-        mock_requests.head.return_value = mock_response
+        mock_session = MagicMock()
+        monkeypatch.setattr(
+            "ultimate_rvc.core.common._get_http_session",
+            lambda: mock_session,
+        )
+        mock_session.head.return_value = mock_response
 
         result = get_file_size("https://example.com/file.zip")
 
         assert result == 0
 
     @pytest.mark.network
-    def test_get_file_size_empty_file(self, mocker: pytest_mock.MockerFixture) -> None:
+    def test_get_file_size_empty_file(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test get_file_size with empty file (content-length: 0)."""
-        mock_response = mocker.MagicMock()
+        mock_response = MagicMock()
         mock_response.headers = {"content-length": "0"}
-        mock_requests = mocker.patch("ultimate_rvc.core.common.requests")
-        mock_requests.head.return_value = mock_response
+        mock_session = MagicMock()
+        monkeypatch.setattr(
+            "ultimate_rvc.core.common._get_http_session",
+            lambda: mock_session,
+        )
+        mock_session.head.return_value = mock_response
 
         result = get_file_size("https://example.com/empty.txt")
 
         assert result == 0  # Empty file should return 0, not None
 
     @pytest.mark.network
-    def test_get_file_size_http_error(self, mocker: pytest_mock.MockerFixture) -> None:
+    def test_get_file_size_http_error(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test get_file_size with HTTP error."""
-        mock_requests = mocker.patch("ultimate_rvc.core.common.requests")
-        mock_requests.head.side_effect = Exception("HTTP Error")
+        mock_session = MagicMock()
+        monkeypatch.setattr(
+            "ultimate_rvc.core.common._get_http_session",
+            lambda: mock_session,
+        )
+        mock_session.head.side_effect = Exception("HTTP Error")
 
         with pytest.raises(Exception, match="HTTP Error"):
             get_file_size("https://example.com/nonexistent.zip")
 
     @pytest.mark.network
-    def test_get_file_size_timeout(self, mocker: pytest_mock.MockerFixture) -> None:
+    def test_get_file_size_timeout(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test get_file_size uses correct timeout."""
-        mock_response = mocker.MagicMock()
+        mock_response = MagicMock()
         mock_response.headers = {"content-length": str(EXPECTED_LARGE_FILE_SIZE)}
-        mock_requests = mocker.patch("ultimate_rvc.core.common.requests")
-        mock_requests.head.return_value = mock_response
+        mock_session = MagicMock()
+        monkeypatch.setattr(
+            "ultimate_rvc.core.common._get_http_session",
+            lambda: mock_session,
+        )
+        mock_session.head.return_value = mock_response
 
         get_file_size("https://example.com/large_file.zip")
 
-        mock_requests.head.assert_called_with(
+        mock_session.head.assert_called_with(
             "https://example.com/large_file.zip", timeout=10
         )
 
@@ -862,9 +933,10 @@ class TestValidateAudioDirExists:
             validate_audio_dir_exists(None, Entity.SONG_DIR)
 
         # Check error message contains the entity name and ui_msg is set
-        error_message = str(exc_info.value)
+        error = exc_info.value
+        error_message = str(error)
         assert "song directory" in error_message
-        assert exc_info.value.ui_msg == UIMessage.NO_SONG_DIR
+        assert error.ui_msg == UIMessage.NO_SONG_DIR
 
     def test_validate_audio_dir_exists_none_input_other_entity(self) -> None:
         """
@@ -874,9 +946,10 @@ class TestValidateAudioDirExists:
         with pytest.raises(NotProvidedError) as exc_info:
             validate_audio_dir_exists(None, Entity.DATASET)
 
-        error_message = str(exc_info.value)
+        error = exc_info.value
+        error_message = str(error)
         assert "dataset" in error_message
-        assert exc_info.value.ui_msg is None
+        assert error.ui_msg is None
 
     def test_validate_audio_dir_exists_empty_string(self) -> None:
         """Test validate_audio_dir_exists with empty string."""
@@ -905,7 +978,7 @@ class TestValidateAudioDirExists:
     ) -> None:
         """Test validate_audio_dir_exists when path points to file."""
         file_path = tmp_path / "audio_file.wav"
-        file_path.write_text("audio data")
+        file_path.touch()
 
         with pytest.raises(NotFoundError) as exc_info:
             validate_audio_dir_exists(file_path, Entity.DIRECTORY)
@@ -918,49 +991,74 @@ class TestValidateAudioDirExists:
 class TestValidateModel:
     """Test cases for validate_model function."""
 
-    def test_validate_model_voice_model_exists(
-        self, tmp_path: Path, mocker: pytest_mock.MockerFixture
+    @pytest.fixture(autouse=True)
+    def _patch_voice_models_dir(
+        self, voice_models_dir: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
-        """Test validate_model for existing voice model."""
-        model_name = "test_voice_model"
-        mock_voice_models_dir = tmp_path / "voice_models"
-        mock_voice_models_dir.mkdir()
-        model_dir = mock_voice_models_dir / model_name
+        """
+        Patch the voice model directory constant for every test in
+        this class.
+
+        Parameters
+        ----------
+        voice_models_dir : Path
+            The voice model directory of the current test.
+        monkeypatch : pytest.MonkeyPatch
+            Fixture for patching module attributes.
+
+        """
+        monkeypatch.setattr(
+            "ultimate_rvc.core.common.VOICE_MODELS_DIR",
+            voice_models_dir,
+        )
+
+    @staticmethod
+    def _make_model_dir(voice_models_dir: Path, name: str) -> Path:
+        """
+        Create a model directory with the given name inside the given
+        voice model directory.
+
+        Parameters
+        ----------
+        voice_models_dir : Path
+            The voice model directory to create the model directory
+            in.
+        name : str
+            The name of the model directory to create.
+
+        Returns
+        -------
+        Path
+            The path to the created model directory.
+
+        """
+        model_dir = voice_models_dir / name
         model_dir.mkdir()
+        return model_dir
 
-        mocker.patch("ultimate_rvc.core.common.VOICE_MODELS_DIR", mock_voice_models_dir)
+    def test_validate_model_voice_model_exists(self, voice_models_dir: Path) -> None:
+        """Test validate_model for existing voice model."""
+        model_name = "test_voice_model"
+        model_dir = self._make_model_dir(voice_models_dir, model_name)
 
         result = validate_model(model_name, Entity.VOICE_MODEL, mode="exists")
 
         assert result == model_dir
 
     def test_validate_model_voice_model_not_exists_success(
-        self, tmp_path: Path, mocker: pytest_mock.MockerFixture
+        self, voice_models_dir: Path
     ) -> None:
         """
         Test validate_model for non-existing voice model
         (success case).
         """
         model_name = "new_voice_model"
-        mock_voice_models_dir = tmp_path / "voice_models"
-        mock_voice_models_dir.mkdir()
-        model_dir = mock_voice_models_dir / model_name
-
-        mocker.patch("ultimate_rvc.core.common.VOICE_MODELS_DIR", mock_voice_models_dir)
+        model_dir = voice_models_dir / model_name
 
         result = validate_model(model_name, Entity.VOICE_MODEL, mode="not_exists")
 
         assert result == model_dir
 
-    def test_validate_model_none_name(self) -> None:
-        """Test validate_model with None model name."""
-        with pytest.raises(NotProvidedError) as exc_info:
-            validate_model(None, Entity.VOICE_MODEL)
-
-        error_message = str(exc_info.value)
-        assert "model name" in error_message
-        assert exc_info.value.ui_msg == UIMessage.NO_VOICE_MODEL
-
     def test_validate_model_empty_name(self) -> None:
         """Test validate_model with empty model name."""
         with pytest.raises(NotProvidedError) as exc_info:
@@ -970,33 +1068,22 @@ class TestValidateModel:
         assert "model name" in error_message
 
     def test_validate_model_whitespace_name_stripped(
-        self, tmp_path: Path, mocker: pytest_mock.MockerFixture
+        self, voice_models_dir: Path
     ) -> None:
         """Test validate_model strips whitespace from model name."""
         model_name = "  test_model  "
-        mock_voice_models_dir = tmp_path / "voice_models"
-        mock_voice_models_dir.mkdir()
-        model_dir = mock_voice_models_dir / "test_model"  # Stripped name
-        model_dir.mkdir()
-
-        mocker.patch("ultimate_rvc.core.common.VOICE_MODELS_DIR", mock_voice_models_dir)
+        model_dir = self._make_model_dir(voice_models_dir, "test_model")
 
         result = validate_model(model_name, Entity.VOICE_MODEL, mode="exists")
 
         assert result == model_dir
 
-    def test_validate_model_not_found_error(
-        self, tmp_path: Path, mocker: pytest_mock.MockerFixture
-    ) -> None:
+    def test_validate_model_not_found_error(self) -> None:
         """
         Test validate_model raises ModelNotFoundError when model
         doesn't exist.
         """
         model_name = "nonexistent_model"
-        mock_voice_models_dir = tmp_path / "voice_models"
-        mock_voice_models_dir.mkdir()
-
-        mocker.patch("ultimate_rvc.core.common.VOICE_MODELS_DIR", mock_voice_models_dir)
 
         with pytest.raises(ModelNotFoundError) as exc_info:
             validate_model(model_name, Entity.VOICE_MODEL, mode="exists")
@@ -1004,20 +1091,13 @@ class TestValidateModel:
         error_message = str(exc_info.value)
         assert f"Voice model with name '{model_name}' not found" in error_message
 
-    def test_validate_model_exists_error(
-        self, tmp_path: Path, mocker: pytest_mock.MockerFixture
-    ) -> None:
+    def test_validate_model_exists_error(self, voice_models_dir: Path) -> None:
         """
         Test validate_model raises ModelExistsError when model
         exists but shouldn't.
         """
         model_name = "existing_model"
-        mock_voice_models_dir = tmp_path / "voice_models"
-        mock_voice_models_dir.mkdir()
-        model_dir = mock_voice_models_dir / model_name
-        model_dir.mkdir()
-
-        mocker.patch("ultimate_rvc.core.common.VOICE_MODELS_DIR", mock_voice_models_dir)
+        self._make_model_dir(voice_models_dir, model_name)
 
         with pytest.raises(ModelExistsError) as exc_info:
             validate_model(model_name, Entity.VOICE_MODEL, mode="not_exists")
@@ -1034,6 +1114,7 @@ class TestValidateModel:
             (Entity.CUSTOM_PRETRAINED_MODEL, UIMessage.NO_CUSTOM_PRETRAINED_MODEL),
             (Entity.MODEL, UIMessage.NO_MODEL),
         ],
+        ids=["voice", "embedder", "training", "pretrained", "model"],
     )
     def test_validate_model_different_entities(
         self, entity: ModelEntity, expected_ui_msg: UIMessage | None
@@ -1042,35 +1123,15 @@ class TestValidateModel:
         with pytest.raises(NotProvidedError) as exc_info:
             validate_model(None, entity)
 
-        error_message = str(exc_info.value)
+        error = exc_info.value
+        error_message = str(error)
         assert "model name" in error_message
-        assert exc_info.value.ui_msg == expected_ui_msg
+        assert error.ui_msg == expected_ui_msg
 
 
 class TestValidateUrl:
     """Test cases for validate_url function."""
 
-    def test_validate_url_valid_http(self) -> None:
-        """Test validate_url with valid HTTP URL."""
-        url = "http://example.com/model.zip"
-
-        # Should not raise any exception
-        validate_url(url)
-
-    def test_validate_url_valid_https(self) -> None:
-        """Test validate_url with valid HTTPS URL."""
-        url = "https://example.com/model.zip"
-
-        # Should not raise any exception
-        validate_url(url)
-
-    def test_validate_url_with_path_and_query(self) -> None:
-        """Test validate_url with complex URL."""
-        url = "https://api.example.com/v1/models/download?id=123&format=zip"
-
-        # Should not raise any exception
-        validate_url(url)
-
     def test_validate_url_empty_string(self) -> None:
         """Test validate_url with empty string."""
         with pytest.raises(NotProvidedError) as exc_info:
@@ -1087,71 +1148,14 @@ class TestValidateUrl:
         error_message = str(exc_info.value)
         assert "URL" in error_message
 
-    def test_validate_url_invalid_scheme(self) -> None:
-        """Test validate_url with invalid scheme."""
-        invalid_url = "ftp://example.com/file.zip"
-
-        with pytest.raises(HttpUrlError) as exc_info:
-            validate_url(invalid_url)
-
-        error_message = str(exc_info.value)
-        assert "Invalid HTTP-based URL" in error_message
-        assert invalid_url in error_message
-
-    def test_validate_url_malformed(self) -> None:
-        """Test validate_url with malformed URL."""
-        malformed_url = "not-a-url"
-
-        with pytest.raises(HttpUrlError) as exc_info:
-            validate_url(malformed_url)
-
-        error_message = str(exc_info.value)
-        assert "Invalid HTTP-based URL" in error_message
-        assert malformed_url in error_message
-
-    def test_validate_url_missing_protocol(self) -> None:
-        """Test validate_url with missing protocol."""
-        url_without_protocol = "example.com/model.zip"
-
-        with pytest.raises(HttpUrlError) as exc_info:
-            validate_url(url_without_protocol)
-
-        error_message = str(exc_info.value)
-        assert "Invalid HTTP-based URL" in error_message
-        assert url_without_protocol in error_message
-
-    @pytest.mark.parametrize(
-        "valid_url",
-        [
-            "http://example.com",
-            "https://example.com",
-            "http://subdomain.example.com/path",
-            "https://example.com:8080/api/v1",
-            "http://192.168.1.1/file.zip",
-            "https://example.com/path?query=value&other=123",
-            "http://example.com/path#fragment",
-        ],
-    )
+    @pytest.mark.parametrize("valid_url", VALID_URLS, ids=VALID_URL_IDS)
     def test_validate_url_valid_urls(self, valid_url: str) -> None:
         """Test validate_url with various valid URLs."""
         # Should not raise any exception
         validate_url(valid_url)
 
-    @pytest.mark.parametrize(
-        "invalid_url",
-        [
-            "ftp://example.com",
-            "file:///path/to/file",
-            "mailto:user@example.com",
-            "javascript:alert('xss')",
-            "//example.com",  # Protocol-relative
-            "example.com",  # Missing protocol
-            "http://",  # Incomplete
-            "",  # Empty
-            "not a url at all",
-        ],
-    )
+    @pytest.mark.parametrize("invalid_url", INVALID_URLS, ids=INVALID_URL_IDS)
     def test_validate_url_invalid_urls(self, invalid_url: str) -> None:
         """Test validate_url with various invalid URLs."""
-        with pytest.raises((HttpUrlError, NotProvidedError)):
+        with pytest.raises(HttpUrlError):
             validate_url(invalid_url)